@@ -0,0 +1,246 @@
+"""
+In-page polling agent: a script injected into each course tab that polls the sections page itself
+and pushes seat changes to a local listener, so Python no longer drives every refresh
+"""
+
+import hmac
+import json
+import queue
+import secrets
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from config import TAMU_SCHEDULER_BASE_URL
+
+# Injected with execute_script. Arguments: course URL ID, course link, listener URL, listener token,
+# min/max seconds between polls, unchanged polls between heartbeats, seconds to wait for a page.
+# The course page is reloaded in a hidden same-origin iframe so the tab itself (and the agent) stays put.
+AGENT_SCRIPT = """
+const [courseId, link, endpoint, token, initialMinDelay, initialMaxDelay, heartbeatPolls, loadTimeout] = arguments;
+
+if (window.__howdyseekAgent) {
+    window.__howdyseekAgent.stop();
+}
+
+const SECTION_CELL = 'css-1p12g40-cellCss-hideOnMobileCss';
+const NO_SECTIONS_XPATH = '//*[@id="scheduler-app"]/div/main/div/div/div[2]/ul/li[1]/a/span';
+
+let minDelay = initialMinDelay;
+let maxDelay = initialMaxDelay;
+let last = null;
+let unchangedPolls = 0;
+let timer = null;
+let stopped = false;
+
+const frame = document.createElement('iframe');
+frame.style.cssText = 'position:absolute;left:-10000px;top:0;width:1280px;height:800px;visibility:hidden;';
+document.body.appendChild(frame);
+
+// text/plain without custom headers is a simple request, so no CORS preflight is needed
+const post = (payload) => fetch(endpoint, {
+    method: 'POST',
+    mode: 'no-cors',
+    body: JSON.stringify(Object.assign({token: token, course_id: courseId}, payload))
+}).catch(() => {});
+
+// Read {crn: seats} from the frame, {} if the course has no sections, null if the page isn't ready
+const readSections = () => {
+    const doc = frame.contentDocument;
+    if (!doc || !doc.body) return null;
+    if (doc.location.href.includes('invalid.aspx')) throw new Error('invalid page');
+    if (doc.body.innerText.includes('invalid request')) throw new Error('invalid request');
+
+    const labels = doc.getElementsByClassName(SECTION_CELL);
+    if (labels.length === 0) {
+        const tab = doc.evaluate(NO_SECTIONS_XPATH, doc, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null);
+        return tab.singleNodeValue && tab.singleNodeValue.textContent === 'Enabled (0 of 0)' ? {} : null;
+    }
+
+    // Same layout main.py relies on: the CRN is every 6th cell and the open seats 3 cells after it
+    const seats = {};
+    for (let i = 0; i + 3 < labels.length; i += 6) {
+        seats[labels[i].innerText.trim()] = parseInt(labels[i + 3].innerText, 10);
+    }
+    return seats;
+};
+
+// Resolve once the frame has navigated, so the previous poll's cells are never read again
+const loadFrame = () => new Promise((resolve, reject) => {
+    const timeout = setTimeout(() => reject(new Error('page did not load')), loadTimeout * 1000);
+    frame.onload = () => {
+        clearTimeout(timeout);
+        resolve();
+    };
+    frame.src = link;
+});
+
+const waitForSections = () => new Promise((resolve, reject) => {
+    const deadline = Date.now() + loadTimeout * 1000;
+    const check = () => {
+        try {
+            const seats = readSections();
+            if (seats !== null) return resolve(seats);
+        } catch (error) {
+            return reject(error);
+        }
+        if (Date.now() > deadline) {
+            const stuck = frame.contentDocument && frame.contentDocument.getElementsByClassName('spinner').length;
+            return reject(new Error(stuck ? 'spinner' : 'sections did not load'));
+        }
+        setTimeout(check, 250);
+    };
+    check();
+});
+
+const poll = async () => {
+    try {
+        await loadFrame();
+        const current = await waitForSections();
+
+        const changes = {};
+        for (const [crn, seats] of Object.entries(current)) {
+            if (last === null || last[crn] !== seats) changes[crn] = seats;
+        }
+        if (last !== null) {
+            for (const crn of Object.keys(last)) {
+                if (!(crn in current)) changes[crn] = null;
+            }
+        }
+
+        if (last === null || Object.keys(changes).length > 0) {
+            post({changes: changes, full: last === null});
+            unchangedPolls = 0;
+        } else if (++unchangedPolls >= heartbeatPolls) {
+            post({heartbeat: true});
+            unchangedPolls = 0;
+        }
+        last = current;
+    } catch (error) {
+        post({error: String(error.message || error)});
+    }
+
+    if (!stopped) {
+        timer = setTimeout(poll, (minDelay + Math.random() * (maxDelay - minDelay)) * 1000);
+    }
+};
+
+window.__howdyseekAgent = {
+    setDelay: (min, max) => {
+        minDelay = min;
+        maxDelay = max;
+    },
+    stop: () => {
+        stopped = true;
+        clearTimeout(timer);
+        frame.remove();
+    }
+};
+
+poll();
+"""
+
+
+# Gives the agent in the current tab a new polling rate. Arguments: min/max seconds between polls.
+AGENT_SET_DELAY_SCRIPT = """
+if (window.__howdyseekAgent) {
+    window.__howdyseekAgent.setDelay(arguments[0], arguments[1]);
+}
+"""
+
+
+# Stops the agent in the current tab, e.g. while its circuit breaker sidelines the course.
+AGENT_STOP_SCRIPT = """
+if (window.__howdyseekAgent) {
+    window.__howdyseekAgent.stop();
+}
+"""
+
+
+class SeatEventListener:
+    """Local HTTP listener that receives seat change events posted by in-page agents.
+
+    The scraper runs in an everyday browser profile, so any open page could post to the listener. Events are
+    only accepted with the random token handed to the agents when they are injected.
+    """
+
+    def __init__(self, port: int):
+        """Constructor.
+
+        Args:
+            port: Local port to listen on
+        """
+        self.events = queue.Queue()
+        self.token = secrets.token_urlsafe(32)  # Changes every run, passed to AGENT_SCRIPT
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self._make_handler())
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """The URL agents post events to."""
+        host, port = self.server.server_address
+        return f"http://{host}:{port}/events"
+
+    def start(self):
+        """Start listening in a background thread."""
+        self.thread.start()
+
+    def get(self, timeout: float):
+        """Wait for the next event.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            The event dict, or None if no event arrived in time
+        """
+        try:
+            return self.events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def _make_handler(self):
+        """Build the request handler class bound to this listener's queue."""
+        events = self.events
+        token = self.token
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send_cors_headers(self):
+                # The scheduler is a public origin posting to localhost, so allow it and only it explicitly
+                self.send_header("Access-Control-Allow-Origin", TAMU_SCHEDULER_BASE_URL)
+                self.send_header("Access-Control-Allow-Methods", "POST, OPTIONS")
+                self.send_header("Access-Control-Allow-Private-Network", "true")
+
+            def do_OPTIONS(self):
+                self.send_response(204)
+                self._send_cors_headers()
+                self.end_headers()
+
+            def do_POST(self):
+                try:
+                    length = int(self.headers.get("Content-Length", 0))
+                    event = json.loads(self.rfile.read(length))
+                    if not isinstance(event, dict):
+                        raise ValueError("event must be an object")
+                except ValueError:
+                    self.send_response(400)
+                    self._send_cors_headers()
+                    self.end_headers()
+                    return
+
+                # Drop events forged by other pages open in the browser
+                if not hmac.compare_digest(str(event.pop("token", "")).encode(), token.encode()):
+                    self.send_response(403)
+                    self._send_cors_headers()
+                    self.end_headers()
+                    return
+
+                events.put(event)
+                self.send_response(204)
+                self._send_cors_headers()
+                self.end_headers()
+
+            def log_message(self, *args):
+                # Agents post constantly, keep the console for notifications
+                pass
+
+        return Handler
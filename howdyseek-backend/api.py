@@ -2,16 +2,28 @@
 HOWDY! SEEK API
 """
 
-from fastapi import FastAPI, Depends, HTTPException, status
+import base64
+import binascii
+import json
+
+from fastapi import FastAPI, Depends, HTTPException, Query, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, or_, func
+from sqlalchemy.orm import Session, joinedload, selectinload
 
-from models import User, Course, Settings, init_db, get_session
+from catalog import CatalogIndex, normalize
+from config import DATABASE_URL
+from models import Term, User, Section, Subscription, WatchRule, Settings, CatalogEntry, init_db, get_session
 
 # Initialize database
-engine = init_db()
+engine = init_db(DATABASE_URL)
+
+# Pagination constants
+MAX_PAGE_SIZE = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+PREFIX_RANGE_END = "\U0010ffff"  # Sorts after any character, closes a prefix range
 
 # Initialize FastAPI app
 app = FastAPI(title="HowdySeek API")
@@ -23,6 +35,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 
@@ -35,6 +48,27 @@ def get_db():
         db.close()
 
 
+def _load_catalog_indexes() -> dict:
+    """Build a catalog index per term from the stored catalog snapshots"""
+    db = get_session(engine)
+    try:
+        entries = {}
+        for entry in db.query(CatalogEntry).all():
+            entries.setdefault(entry.term_id, []).append(entry.to_dict())
+        return {term_id: CatalogIndex(term_entries) for term_id, term_entries in entries.items()}
+    finally:
+        db.close()
+
+
+# Maps term IDs to their catalog index, rebuilt whenever the scraper uploads a new snapshot of the term
+catalog_indexes = _load_catalog_indexes()
+
+
+def _catalog_for(term_id: int) -> CatalogIndex:
+    """Get a term's catalog index, empty if the term has no snapshot yet"""
+    return catalog_indexes.get(term_id) or CatalogIndex()
+
+
 # Pydantic models for request validation
 class CourseBase(BaseModel):
     course_name: str
@@ -43,11 +77,67 @@ class CourseBase(BaseModel):
 
 
 class CourseCreate(CourseBase):
-    pass
+    term_id: Optional[int] = None  # May be left out while only one term is active
 
 
 class CourseResponse(CourseBase):
     id: int
+    term_id: int
+
+    class Config:
+        orm_mode = True
+
+
+class SubscriberResponse(BaseModel):
+    webhook_url: str
+    professor: str
+
+
+class SectionResponse(CourseBase):
+    id: int
+    term_id: int
+    webhook_urls: List[str] = []
+    subscribers: List[SubscriberResponse] = []  # Each subscriber's own professor text for notifications
+
+    class Config:
+        orm_mode = True
+
+
+class WatchRuleBase(BaseModel):
+    course_name: str
+    professor: Optional[str] = None  # Any professor if left out
+    min_seats: int = 1
+
+
+class WatchRuleCreate(WatchRuleBase):
+    term_id: Optional[int] = None  # May be left out while only one term is active
+
+
+class WatchRuleResponse(WatchRuleBase):
+    id: int
+    term_id: int
+    webhook_url: str
+
+    class Config:
+        orm_mode = True
+
+
+class TermBase(BaseModel):
+    name: str
+    active: bool = True
+
+
+class TermCreate(TermBase):
+    pass
+
+
+class TermUpdate(BaseModel):
+    name: Optional[str] = None
+    active: Optional[bool] = None
+
+
+class TermResponse(TermBase):
+    id: int
 
     class Config:
         orm_mode = True
@@ -75,12 +165,189 @@ class UserResponse(UserBase):
         orm_mode = True
 
 
+# Keyset pagination helpers
+def _encode_cursor(sort_value, row_id: int) -> str:
+    """Encode the sort key of the last row on a page into an opaque cursor"""
+    return base64.urlsafe_b64encode(json.dumps([sort_value, row_id]).encode()).decode()
+
+
+def _decode_cursor(cursor: str, sort_type: type) -> tuple:
+    """Decode a cursor back into the (sort value, id) of the last row on the previous page.
+    The sort value must be of sort_type: int when sorting by ID, str for the text sort keys."""
+    try:
+        decoded = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    # Only cursors shaped like the ones we hand out may reach the query
+    if (not isinstance(decoded, list) or len(decoded) != 2
+            or not isinstance(decoded[0], sort_type) or isinstance(decoded[0], bool)
+            or not isinstance(decoded[1], int) or isinstance(decoded[1], bool)):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    sort_value, row_id = decoded
+    return sort_value, row_id
+
+
+def _prefix_filter(expression, prefix: str):
+    """Match rows whose lowercased expression starts with prefix.
+    Uses a range instead of LIKE so SQLite can use the expression index."""
+    prefix = prefix.lower()
+    return and_(expression >= prefix, expression < prefix + PREFIX_RANGE_END)
+
+
+def _paginate(query, sort_key, id_column, descending: bool, cursor: Optional[str], limit: Optional[int],
+              response: Response) -> list:
+    """Apply keyset pagination to a query ordered by (sort_key, id).
+
+    Sets the next page cursor header on the response when more rows are available.
+    Without a limit every remaining row is returned, so clients that don't follow cursors see the full list.
+    """
+    if cursor is not None:
+        sort_value, last_id = _decode_cursor(cursor, int if sort_key is id_column else str)
+        if descending:
+            query = query.filter(or_(sort_key < sort_value, and_(sort_key == sort_value, id_column < last_id)))
+        else:
+            query = query.filter(or_(sort_key > sort_value, and_(sort_key == sort_value, id_column > last_id)))
+
+    if descending:
+        query = query.order_by(sort_key.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_key, id_column)
+
+    if limit is None:
+        return [row for row, _ in query.add_columns(sort_key).all()]
+
+    # Fetch one extra row to know whether there is another page
+    rows = query.add_columns(sort_key).limit(limit + 1).all()
+    if len(rows) > limit:
+        last_row, last_sort_value = rows[limit - 1]
+        response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(last_sort_value, last_row.id)
+
+    return [row for row, _ in rows[:limit]]
+
+
 # API Routes
+USER_SORT_KEYS = {
+    "id": User.id,
+    "name": func.lower(User.name),
+}
+
+COURSE_SORT_KEYS = {
+    "id": Subscription.id,
+    "course_name": func.lower(Section.course_name),
+    "crn": Section.crn,
+}
+
+SECTION_SORT_KEYS = {
+    "id": Section.id,
+    "course_name": func.lower(Section.course_name),
+    "crn": Section.crn,
+}
+
+
+def _resolve_term(db: Session, term_id: Optional[int]) -> Term:
+    """Look up the term a request is for.
+    Without a term ID, the only active term is used so single-term clients keep working."""
+    if term_id is not None:
+        term = db.query(Term).filter(Term.id == term_id).first()
+        if term is None:
+            raise HTTPException(status_code=400, detail=f"Term {term_id} not found")
+        return term
+
+    active_terms = db.query(Term).filter(Term.active.is_(True)).limit(2).all()
+    if len(active_terms) != 1:
+        raise HTTPException(status_code=400, detail="term_id is required unless exactly one term is active")
+    return active_terms[0]
+
+
+def _delete_orphan_sections(db: Session):
+    """Delete sections nobody is subscribed to anymore, so the scraper stops watching them"""
+    db.query(Section).filter(~Section.subscriptions.any()).delete(synchronize_session=False)
+
+
+@app.get("/terms/", response_model=List[TermResponse])
+def get_terms(db: Session = Depends(get_db)):
+    """Get all registered terms"""
+    return db.query(Term).order_by(Term.id).all()
+
+
+@app.post("/terms/", response_model=TermResponse, status_code=status.HTTP_201_CREATED)
+def create_term(term: TermCreate, db: Session = Depends(get_db)):
+    """Register a term to monitor, named as on the scheduler's term selection page"""
+    if db.query(Term).filter(Term.name == term.name).first():
+        raise HTTPException(status_code=400, detail="Term already registered")
+
+    db_term = Term(name=term.name, active=term.active)
+    db.add(db_term)
+    db.commit()
+    db.refresh(db_term)
+    return db_term
+
+
+@app.put("/terms/{term_id}", response_model=TermResponse)
+def update_term(term_id: int, term: TermUpdate, db: Session = Depends(get_db)):
+    """Rename a term or pause and resume monitoring it"""
+    db_term = db.query(Term).filter(Term.id == term_id).first()
+    if db_term is None:
+        raise HTTPException(status_code=404, detail="Term not found")
+
+    if term.name is not None and term.name != db_term.name:
+        if db.query(Term).filter(Term.name == term.name).first():
+            raise HTTPException(status_code=400, detail="Term already registered")
+        db_term.name = term.name
+    if term.active is not None:
+        db_term.active = term.active
+
+    db.commit()
+    db.refresh(db_term)
+    return db_term
+
+
+@app.delete("/terms/{term_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_term(term_id: int, db: Session = Depends(get_db)):
+    """Delete a term nobody is watching courses in, along with its catalog"""
+    db_term = db.query(Term).filter(Term.id == term_id).first()
+    if db_term is None:
+        raise HTTPException(status_code=404, detail="Term not found")
+
+    if (db.query(Section).filter(Section.term_id == term_id).first()
+            or db.query(WatchRule).filter(WatchRule.term_id == term_id).first()):
+        raise HTTPException(status_code=400, detail="Term still has watched courses")
+
+    db.query(CatalogEntry).filter(CatalogEntry.term_id == term_id).delete()
+    db.delete(db_term)
+    db.commit()
+    catalog_indexes.pop(term_id, None)
+    return None
+
+
 @app.get("/users/", response_model=List[UserResponse])
-def get_users(db: Session = Depends(get_db)):
-    """Get all users with their courses"""
-    users = db.query(User).all()
-    return users
+def get_users(
+        response: Response,
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+        cursor: Optional[str] = None,
+        name: Optional[str] = None,
+        course: Optional[str] = None,
+        crn: Optional[str] = None,
+        sort: str = Query("id", pattern=r"^-?(id|name)$"),
+        db: Session = Depends(get_db)
+):
+    """Get users with their courses, a page at a time when a limit is given.
+    Filters by name prefix, course name prefix or CRN. Prefix sort with '-' for descending order.
+    With a limit, the cursor for the next page is returned in the X-Next-Cursor header."""
+    query = db.query(User).options(selectinload(User.subscriptions).joinedload(Subscription.section))
+
+    if name:
+        query = query.filter(_prefix_filter(func.lower(User.name), name))
+    if course:
+        query = query.filter(User.subscriptions.any(
+            Subscription.section.has(_prefix_filter(func.lower(Section.course_name), course))
+        ))
+    if crn:
+        query = query.filter(User.subscriptions.any(Subscription.section.has(Section.crn == crn)))
+
+    descending = sort.startswith("-")
+    return _paginate(query, USER_SORT_KEYS[sort.lstrip("-")], User.id, descending, cursor, limit, response)
 
 
 @app.get("/users/{user_id}", response_model=UserResponse)
@@ -134,17 +401,47 @@ def delete_user(user_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="User not found")
 
     db.delete(db_user)
+    db.flush()
+    _delete_orphan_sections(db)
     db.commit()
     return None
 
 
 @app.get("/users/{user_id}/courses", response_model=List[CourseResponse])
-def get_user_courses(user_id: int, db: Session = Depends(get_db)):
-    """Get all courses for a specific user"""
+def get_user_courses(
+        user_id: int,
+        response: Response,
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+        cursor: Optional[str] = None,
+        course: Optional[str] = None,
+        crn: Optional[str] = None,
+        term_id: Optional[int] = None,
+        sort: str = Query("id", pattern=r"^-?(id|course_name|crn)$"),
+        db: Session = Depends(get_db)
+):
+    """Get the courses of a specific user, a page at a time when a limit is given.
+    Filters by course name prefix, CRN or term. Prefix sort with '-' for descending order.
+    With a limit, the cursor for the next page is returned in the X-Next-Cursor header."""
     user = db.query(User).filter(User.id == user_id).first()
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
-    return user.courses
+
+    query = (
+        db.query(Subscription)
+        .join(Subscription.section)
+        .options(joinedload(Subscription.section))
+        .filter(Subscription.user_id == user_id)
+    )
+
+    if course:
+        query = query.filter(_prefix_filter(func.lower(Section.course_name), course))
+    if crn:
+        query = query.filter(Section.crn == crn)
+    if term_id is not None:
+        query = query.filter(Section.term_id == term_id)
+
+    descending = sort.startswith("-")
+    return _paginate(query, COURSE_SORT_KEYS[sort.lstrip("-")], Subscription.id, descending, cursor, limit, response)
 
 
 @app.post("/users/{user_id}/courses", response_model=CourseResponse, status_code=status.HTTP_201_CREATED)
@@ -154,23 +451,42 @@ def create_course(user_id: int, course: CourseCreate, db: Session = Depends(get_
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
 
+    term = _resolve_term(db, course.term_id)
+
     # Check if course with same CRN already exists for this user
-    existing_course = db.query(Course).filter(
-        Course.user_id == user_id,
-        Course.crn == course.crn
+    existing_course = db.query(Subscription).join(Subscription.section).filter(
+        Subscription.user_id == user_id,
+        Section.term_id == term.id,
+        Section.crn == course.crn
     ).first()
 
     if existing_course:
         raise HTTPException(status_code=400, detail="Course with this CRN already exists for this user")
 
-    # Create new course
-    db_course = Course(
-        course_name=course.course_name,
-        professor=course.professor,
-        crn=course.crn,
-        user_id=user_id
-    )
+    # Catch typos before the scraper wastes a tab on them
+    catalog = _catalog_for(term.id)
+    catalog_error = catalog.validate(course.course_name, course.crn)
+    if catalog_error:
+        raise HTTPException(status_code=400, detail=catalog_error)
+
+    # Share the section with anyone already watching this CRN in this term
+    section = db.query(Section).filter(Section.term_id == term.id, Section.crn == course.crn).first()
+    if section is None:
+        section = Section(
+            term_id=term.id,
+            course_name=catalog.canonical_course_name(course.course_name),
+            professor=course.professor,
+            crn=course.crn
+        )
+        db.add(section)
+    elif normalize(section.course_name) != normalize(course.course_name):
+        raise HTTPException(
+            status_code=400,
+            detail=f"CRN {course.crn} is already watched as {section.course_name}, not {course.course_name}"
+        )
 
+    # The section keeps the first watcher's professor, each subscription keeps its own
+    db_course = Subscription(user_id=user_id, section=section, user_professor=course.professor)
     db.add(db_course)
     db.commit()
     db.refresh(db_course)
@@ -180,20 +496,207 @@ def create_course(user_id: int, course: CourseCreate, db: Session = Depends(get_
 @app.delete("/courses/{course_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_course(course_id: int, db: Session = Depends(get_db)):
     """Delete a course"""
-    db_course = db.query(Course).filter(Course.id == course_id).first()
+    db_course = db.query(Subscription).filter(Subscription.id == course_id).first()
     if db_course is None:
         raise HTTPException(status_code=404, detail="Course not found")
 
     db.delete(db_course)
+    db.flush()
+    _delete_orphan_sections(db)
     db.commit()
     return None
 
 
+@app.get("/sections/", response_model=List[SectionResponse])
+def get_sections(
+        response: Response,
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+        cursor: Optional[str] = None,
+        course: Optional[str] = None,
+        term_id: Optional[int] = None,
+        sort: str = Query("id", pattern=r"^-?(id|course_name|crn)$"),
+        db: Session = Depends(get_db)
+):
+    """Get the watched sections, each with the webhook URLs and professor text of its subscribers.
+    This is what the scraper polls: every CRN appears once however many users watch it.
+    With a limit, the cursor for the next page is returned in the X-Next-Cursor header."""
+    query = db.query(Section).options(
+        selectinload(Section.subscriptions).joinedload(Subscription.user)
+    )
+
+    if course:
+        query = query.filter(_prefix_filter(func.lower(Section.course_name), course))
+    if term_id is not None:
+        query = query.filter(Section.term_id == term_id)
+
+    descending = sort.startswith("-")
+    return _paginate(query, SECTION_SORT_KEYS[sort.lstrip("-")], Section.id, descending, cursor, limit, response)
+
+
+@app.get("/users/{user_id}/rules", response_model=List[WatchRuleResponse])
+def get_user_rules(
+        user_id: int,
+        response: Response,
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+        cursor: Optional[str] = None,
+        db: Session = Depends(get_db)
+):
+    """Get the watch rules of a specific user, a page at a time when a limit is given.
+    With a limit, the cursor for the next page is returned in the X-Next-Cursor header."""
+    user = db.query(User).filter(User.id == user_id).first()
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    query = db.query(WatchRule).filter(WatchRule.user_id == user_id)
+    return _paginate(query, WatchRule.id, WatchRule.id, False, cursor, limit, response)
+
+
+@app.post("/users/{user_id}/rules", response_model=WatchRuleResponse, status_code=status.HTTP_201_CREATED)
+def create_rule(user_id: int, rule: WatchRuleCreate, db: Session = Depends(get_db)):
+    """Watch every section of a course, optionally only a professor's and only with enough open seats"""
+    user = db.query(User).filter(User.id == user_id).first()
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    if rule.min_seats < 1:
+        raise HTTPException(status_code=400, detail="Minimum seats must be at least 1")
+
+    if not rule.course_name.strip():
+        raise HTTPException(status_code=400, detail="Course name is required")
+
+    term = _resolve_term(db, rule.term_id)
+
+    # A rule has no CRN to vouch for its course, so an unlisted course would have the scraper look for it forever
+    catalog = _catalog_for(term.id)
+    catalog_error = catalog.validate_course(rule.course_name)
+    if catalog_error:
+        raise HTTPException(status_code=400, detail=catalog_error)
+
+    course_name = catalog.canonical_course_name(" ".join(rule.course_name.split()))
+    professor = " ".join(rule.professor.split()) if rule.professor and rule.professor.strip() else None
+
+    # Check if the same rule already exists for this user
+    existing_rule = db.query(WatchRule).filter(
+        WatchRule.user_id == user_id,
+        WatchRule.term_id == term.id,
+        func.lower(WatchRule.course_name) == course_name.lower(),
+        func.lower(func.coalesce(WatchRule.professor, "")) == (professor or "").lower(),
+        WatchRule.min_seats == rule.min_seats
+    ).first()
+
+    if existing_rule:
+        raise HTTPException(status_code=400, detail="Watch rule already exists for this user")
+
+    db_rule = WatchRule(
+        user_id=user_id,
+        term_id=term.id,
+        course_name=course_name,
+        professor=professor,
+        min_seats=rule.min_seats
+    )
+
+    db.add(db_rule)
+    db.commit()
+    db.refresh(db_rule)
+    return db_rule
+
+
+@app.delete("/rules/{rule_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_rule(rule_id: int, db: Session = Depends(get_db)):
+    """Delete a watch rule"""
+    db_rule = db.query(WatchRule).filter(WatchRule.id == rule_id).first()
+    if db_rule is None:
+        raise HTTPException(status_code=404, detail="Watch rule not found")
+
+    db.delete(db_rule)
+    db.commit()
+    return None
+
+
+@app.get("/rules/", response_model=List[WatchRuleResponse])
+def get_rules(
+        response: Response,
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+        cursor: Optional[str] = None,
+        term_id: Optional[int] = None,
+        db: Session = Depends(get_db)
+):
+    """Get everyone's watch rules, each with its owner's webhook URL.
+    This is what the scraper compiles into its rule index.
+    With a limit, the cursor for the next page is returned in the X-Next-Cursor header."""
+    query = db.query(WatchRule).options(joinedload(WatchRule.user))
+
+    if term_id is not None:
+        query = query.filter(WatchRule.term_id == term_id)
+
+    return _paginate(query, WatchRule.id, WatchRule.id, False, cursor, limit, response)
+
+
+# Catalog models and endpoints
+class CatalogEntryBase(BaseModel):
+    course_name: str
+    professor: str = ""
+    crn: str
+
+
+class CatalogEntryResponse(CatalogEntryBase):
+    id: int
+    term_id: int
+
+    class Config:
+        orm_mode = True
+
+
+@app.put("/catalog/")
+def replace_catalog(entries: List[CatalogEntryBase], term_id: Optional[int] = None, partial: bool = False,
+                    db: Session = Depends(get_db)):
+    """Replace a term's catalog with a new snapshot from the scraper.
+    A partial snapshot, taken when some sections pages failed to load, only replaces the courses it lists."""
+    term = _resolve_term(db, term_id)
+
+    # Keep the last entry for a CRN if the snapshot lists it twice
+    unique_entries = {
+        entry.crn: {"course_name": entry.course_name, "professor": entry.professor, "crn": entry.crn}
+        for entry in entries
+    }
+
+    existing = db.query(CatalogEntry).filter(CatalogEntry.term_id == term.id)
+    if partial:
+        course_names = {entry["course_name"] for entry in unique_entries.values()}
+        for row in existing:
+            if row.course_name not in course_names and row.crn not in unique_entries:
+                unique_entries[row.crn] = {"course_name": row.course_name, "professor": row.professor, "crn": row.crn}
+
+    existing.delete()
+    db.add_all([CatalogEntry(term_id=term.id, **entry) for entry in unique_entries.values()])
+    db.commit()
+
+    catalog_indexes[term.id] = CatalogIndex([
+        entry.to_dict() for entry in db.query(CatalogEntry).filter(CatalogEntry.term_id == term.id).all()
+    ])
+    return {"count": len(catalog_indexes[term.id])}
+
+
+@app.get("/catalog/search", response_model=List[CatalogEntryResponse])
+def search_catalog(
+        q: str,
+        field: str = Query("course_name", pattern=r"^(course_name|professor|crn)$"),
+        limit: int = Query(10, ge=1, le=100),
+        term_id: Optional[int] = None,
+        db: Session = Depends(get_db)
+):
+    """Autocomplete a term's catalog entries whose course name, professor or CRN starts with q"""
+    term = _resolve_term(db, term_id)
+    return _catalog_for(term.id).search(q, field, limit)
+
+
 # Settings models and endpoints
 class SettingsResponse(BaseModel):
     id: int
     min_refresh_interval: float
     max_refresh_interval: float
+    profiling_enabled: bool
+    requests_per_minute: float
 
     class Config:
         orm_mode = True
@@ -202,6 +705,8 @@ class SettingsResponse(BaseModel):
 class SettingsUpdate(BaseModel):
     min_refresh_interval: Optional[float] = None
     max_refresh_interval: Optional[float] = None
+    profiling_enabled: Optional[bool] = None
+    requests_per_minute: Optional[float] = None
 
 
 @app.get("/settings/", response_model=SettingsResponse)
@@ -242,11 +747,21 @@ def update_settings(settings_update: SettingsUpdate, db: Session = Depends(get_d
             detail="Maximum refresh interval cannot be less than minimum"
         )
 
+    if settings_update.requests_per_minute is not None and settings_update.requests_per_minute < 0:
+        raise HTTPException(
+            status_code=400,
+            detail="Requests per minute cannot be negative"
+        )
+
     # Update fields if provided
     if min_interval is not None:
         db_settings.min_refresh_interval = min_interval
     if max_interval is not None:
         db_settings.max_refresh_interval = max_interval
+    if settings_update.profiling_enabled is not None:
+        db_settings.profiling_enabled = settings_update.profiling_enabled
+    if settings_update.requests_per_minute is not None:
+        db_settings.requests_per_minute = settings_update.requests_per_minute
 
     db.commit()
     db.refresh(db_settings)
@@ -0,0 +1,153 @@
+"""
+In-memory prefix index over the term catalog for autocomplete and course validation
+"""
+
+from bisect import bisect_left
+
+
+def normalize(text: str) -> str:
+    """Normalize text for case and whitespace insensitive matching."""
+    return " ".join(text.lower().split())
+
+
+class PrefixIndex:
+    """Sorted list of (key, entry id) pairs searched with binary search.
+
+    Every entry is indexed under its full normalized text and under each word of it,
+    so "bei" finds "Jeremy Beideman" and "314" finds "CSCE 314".
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self.keys = []  # Sorted list of (key, entry id) tuples
+
+    def build(self, items: list):
+        """Build the index.
+
+        Args:
+            items: List of (text, entry id) tuples
+        """
+        keys = set()
+        for text, entry_id in items:
+            text = normalize(text)
+            if not text:
+                continue
+            keys.add((text, entry_id))
+            for word in text.split(" "):
+                keys.add((word, entry_id))
+        self.keys = sorted(keys)
+
+    def search(self, prefix: str, limit: int) -> list:
+        """Find entries with a key starting with prefix.
+
+        Args:
+            prefix: The text typed so far
+            limit: Maximum number of entry ids to return
+
+        Returns:
+            list: Matching entry ids, in key order, without duplicates
+        """
+        prefix = normalize(prefix)
+        matches = []
+        seen = set()
+
+        position = bisect_left(self.keys, (prefix,))
+        while position < len(self.keys) and len(matches) < limit:
+            key, entry_id = self.keys[position]
+            if not key.startswith(prefix):
+                break
+            if entry_id not in seen:
+                seen.add(entry_id)
+                matches.append(entry_id)
+            position += 1
+
+        return matches
+
+
+class CatalogIndex:
+    """Term catalog held in memory with prefix indexes per searchable field."""
+
+    FIELDS = ("course_name", "professor", "crn")
+
+    def __init__(self, entries: list = None):
+        """Constructor.
+
+        Args:
+            entries: List of catalog entry dicts with course_name, professor and crn keys
+        """
+        self.entries = {}  # Maps entry ids to entry dicts
+        self.by_crn = {}  # Maps CRNs to entry dicts
+        self.course_names = {}  # Maps normalized course names to their catalog spelling
+        self.indexes = {field: PrefixIndex() for field in self.FIELDS}
+        self.build(entries or [])
+
+    def build(self, entries: list):
+        """Rebuild the index from a list of catalog entry dicts."""
+        self.entries = {entry_id: entry for entry_id, entry in enumerate(entries)}
+        self.by_crn = {entry["crn"]: entry for entry in entries}
+        self.course_names = {normalize(entry["course_name"]): entry["course_name"] for entry in entries}
+
+        for field, index in self.indexes.items():
+            index.build([(entry[field], entry_id) for entry_id, entry in self.entries.items()])
+
+    def __len__(self):
+        return len(self.entries)
+
+    def search(self, prefix: str, field: str, limit: int) -> list:
+        """Find catalog entries whose field starts with prefix.
+
+        Args:
+            prefix: The text typed so far
+            field: One of course_name, professor or crn
+            limit: Maximum number of entries to return
+
+        Returns:
+            list: Matching catalog entry dicts
+        """
+        return [self.entries[entry_id] for entry_id in self.indexes[field].search(prefix, limit)]
+
+    def canonical_course_name(self, course_name: str) -> str:
+        """Get the catalog spelling of a course name, so "csce  314" is stored as "CSCE 314".
+
+        Returns:
+            str: The catalog spelling, or course_name unchanged if it isn't in the catalog
+        """
+        return self.course_names.get(normalize(course_name), course_name)
+
+    def validate_course(self, course_name: str):
+        """Check a course name against the catalog, for watch rules that name a course without a CRN.
+
+        Returns:
+            An error message with suggestions, or None if the course is listed or the term has no catalog yet
+        """
+        if not self.entries or normalize(course_name) in self.course_names:
+            return None
+
+        suggestions = [entry["course_name"] for entry in self.search(normalize(course_name).split(" ")[0], "course_name", 50)]
+        suggestions = sorted(set(suggestions))[:5]
+        hint = f" Did you mean: {', '.join(suggestions)}?" if suggestions else ""
+        return f"Course {course_name} is not in the term catalog.{hint}"
+
+    def validate(self, course_name: str, crn: str):
+        """Check a course against the catalog.
+
+        Courses the catalog doesn't list are let through: a course without sections has no rows, and neither
+        does one whose sections page didn't load during the snapshot.
+
+        Args:
+            course_name: The course name entered by the user
+            crn: The CRN entered by the user
+
+        Returns:
+            An error message, or None if the course is valid or not in the catalog
+        """
+        entry = self.by_crn.get(crn.strip())
+        if entry is not None:
+            if normalize(entry["course_name"]) != normalize(course_name):
+                return f"CRN {crn} belongs to {entry['course_name']}, not {course_name}"
+            return None
+
+        if normalize(course_name) in self.course_names:
+            return f"CRN {crn} is not in the term catalog for {self.canonical_course_name(course_name)}"
+
+        return None
@@ -2,16 +2,52 @@
 Environment configuration file
 """
 
+import os
+
 # Chrome profile configuration
 USER_DATA_DIR_ARG = r'user-data-dir=/home/michael/.config/chromium/'
 PROFILE_DIR_ARG = '--profile-directory=Default'
 
 # TAMU URLs
 TAMU_SCHEDULER_BASE_URL = "https://tamu.collegescheduler.com"
-FALL_2025_URL = f"{TAMU_SCHEDULER_BASE_URL}/terms/Fall%202025%20-%20College%20Station/options"
-TERM_STRING = '//*[@id="Fall 2025 - College Station"]'
+
+# Term registered on first start. Further terms and campuses are added through the API
+DEFAULT_TERM = "Fall 2025 - College Station"
 
 # API and other constants
 API_BASE_URL = "http://localhost:8000"
+DATABASE_URL = os.environ.get("HOWDYSEEK_DB_URL", "sqlite:///howdyseek.db")  # Overridable for load tests
+API_PAGE_SIZE = 500  # Users fetched per request when loading the configuration
 INVALID_PAGE_STRING = "invalid.aspx?aspxerrorpath=/"
 DEFAULT_REFRESH_INTERVAL_RANGE = (30, 40)  # Default seconds range if API fails
+CATALOG_SNAPSHOT_ENABLED = True  # Snapshot the term catalog on startup for course validation and autocomplete
+
+# Retry policy for course tabs
+TAB_TIME_BUDGET = 30  # Max seconds spent waiting on a single tab per cycle
+BACKOFF_BASE_DELAY = 1.0  # Seconds before the first retry, doubled every attempt
+BACKOFF_MAX_DELAY = 8.0  # Upper bound for a single backoff delay
+BREAKER_FAILURE_THRESHOLD = 3  # Consecutive failed checks before a course tab is sidelined
+BREAKER_COOLDOWN = 120  # Seconds a sidelined tab waits before it is probed again
+BREAKER_MAX_COOLDOWN = 1800  # Upper bound for the cooldown after repeated failed probes
+
+# Profiling of the monitoring loop, switched on with the profiling_enabled setting or SIGUSR1
+PROFILE_DIR = "profiles"  # Where per-cycle profiles are written
+PROFILE_KEEP = 20  # Number of cycle profiles kept on disk
+PROFILE_SAMPLE_INTERVAL = 0.005  # Seconds between stack samples
+PROFILE_TOP_N = 15  # Functions listed in each cycle summary
+
+# In-page polling agents: each course tab polls itself and pushes seat changes to a local listener
+AGENT_MODE = False  # Use in-page agents instead of refreshing every tab through WebDriver
+AGENT_LISTENER_PORT = 8001  # Local port the agents post seat changes to
+AGENT_HEARTBEAT_POLLS = 5  # Unchanged polls between heartbeats, so silent agents can be detected
+AGENT_STALE_MARGIN = 60  # Seconds of slack past an agent's expected heartbeat before its tab is reloaded
+AGENT_LOAD_TIMEOUT = 20  # Seconds an agent waits for the sections page to load
+
+# Global request governor for the scheduler host
+DEFAULT_REQUESTS_PER_MINUTE = 0.0  # Used if the API fails, 0 disables the governor
+GOVERNOR_BURST = 3  # Requests that may be sent back to back after an idle period
+GOVERNOR_JITTER = 1.0  # Max random seconds added when waiting for a token
+GOVERNOR_DECREASE = 0.5  # Rate multiplier applied when an error page is seen
+GOVERNOR_INCREASE = 0.02  # Fraction of the ceiling restored after every clean check
+GOVERNOR_MIN_FACTOR = 0.1  # Lowest fraction of the ceiling the rate is cut to
+GOVERNOR_PENALTY_WINDOW = 15  # Seconds after a cut during which further errors don't cut again
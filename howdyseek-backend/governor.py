@@ -0,0 +1,134 @@
+"""
+Global request governor: a token bucket over every request to the scheduler host that tightens on
+error pages and shares the budget between courses by priority
+"""
+
+import random
+import time
+
+from config import (
+    GOVERNOR_BURST, GOVERNOR_JITTER, GOVERNOR_DECREASE, GOVERNOR_INCREASE, GOVERNOR_MIN_FACTOR,
+    GOVERNOR_PENALTY_WINDOW
+)
+
+
+class RequestGovernor:
+    """Token bucket with additive-increase/multiplicative-decrease rate control.
+
+    The configured requests per minute is the ceiling. Every error page cuts the effective rate
+    (at most once per penalty window), and every clean check slowly restores it.
+    """
+
+    def __init__(self, requests_per_minute: float):
+        """Constructor.
+
+        Args:
+            requests_per_minute: Ceiling for requests to the scheduler host, 0 disables the governor
+        """
+        self.requests_per_minute = requests_per_minute
+        self.factor = 1.0  # Fraction of the ceiling currently allowed
+        self.tokens = GOVERNOR_BURST
+        self.updated = time.monotonic()
+        self.last_penalty = None
+        self.passes = {}  # Maps course names to their stride scheduling pass value
+
+    @property
+    def enabled(self) -> bool:
+        """Whether requests are being governed."""
+        return self.requests_per_minute > 0
+
+    @property
+    def effective_rpm(self) -> float:
+        """The requests per minute currently allowed."""
+        return self.requests_per_minute * self.factor
+
+    def set_rate(self, requests_per_minute: float):
+        """Update the ceiling, e.g. after the settings changed."""
+        if requests_per_minute != self.requests_per_minute:
+            self._refill()
+            self.requests_per_minute = requests_per_minute
+
+    def _refill(self):
+        """Add the tokens earned since the last update."""
+        now = time.monotonic()
+        if self.enabled:
+            self.tokens = min(GOVERNOR_BURST, self.tokens + (now - self.updated) * self.effective_rpm / 60)
+        self.updated = now
+
+    def acquire(self):
+        """Block until a request to the scheduler host may be sent."""
+        if not self.enabled:
+            return
+
+        self._refill()
+        if self.tokens < 1:
+            wait = (1 - self.tokens) * 60 / self.effective_rpm
+            time.sleep(wait + random.uniform(0, GOVERNOR_JITTER))
+            self._refill()
+        self.tokens -= 1
+
+    def penalize(self, reason: str):
+        """Tighten the rate after an error page, spinner or invalid request.
+
+        Args:
+            reason: What was seen, for the console
+        """
+        now = time.monotonic()
+        if not self.enabled or (self.last_penalty is not None and now - self.last_penalty < GOVERNOR_PENALTY_WINDOW):
+            return
+
+        self._refill()
+        self.factor = max(GOVERNOR_MIN_FACTOR, self.factor * GOVERNOR_DECREASE)
+        # Drop any saved-up burst so the cut takes effect immediately
+        self.tokens = min(self.tokens, 0)
+        self.last_penalty = now
+        print(f"Rate governor tightened to {self.effective_rpm:.1f} requests/min ({reason})")
+
+    def reward(self):
+        """Loosen the rate a little after a clean check."""
+        self._refill()
+        self.factor = min(1.0, self.factor + GOVERNOR_INCREASE)
+
+    def plan(self, priorities: dict, slots: int) -> list:
+        """Choose which courses to refresh next, in proportion to their priority (stride scheduling).
+
+        Args:
+            priorities: Maps course names to a positive priority
+            slots: Number of refreshes to plan
+
+        Returns:
+            list: Course names in the order they should be refreshed, repeated or left out by priority
+        """
+        if not priorities:
+            return []
+
+        # New courses start level with the others instead of catching up on missed turns
+        known = [self.passes[course] for course in priorities if course in self.passes]
+        start = min(known) if known else 0.0
+        self.passes = {course: self.passes.get(course, start) for course in priorities}
+
+        order = []
+        for _ in range(slots):
+            course = min(priorities, key=lambda name: (self.passes[name], name))
+            order.append(course)
+            self.passes[course] += 1 / priorities[course]
+        return order
+
+    def interval_for(self, course: str, priorities: dict) -> float:
+        """Seconds between refreshes of a course that would spend its share of the budget.
+
+        Args:
+            course: The course name
+            priorities: Maps course names to a positive priority
+        """
+        share = priorities[course] / sum(priorities.values())
+        return 60 / (self.effective_rpm * share)
+
+    def to_dict(self) -> dict:
+        """Return the governor state for debugging."""
+        return {
+            "requests_per_minute": self.requests_per_minute,
+            "effective_rpm": self.effective_rpm,
+            "tokens": self.tokens,
+            "factor": self.factor
+        }
@@ -0,0 +1,307 @@
+"""
+HOWDY! SEEK API load test
+
+Seeds a synthetic dataset into a throwaway database, starts the API on it with uvicorn,
+and drives mixed traffic from simulated scrapers and frontends. Reports throughput,
+p50/p99 latency and error rate per endpoint.
+
+Usage:
+    python loadtest.py --users 2000 --courses-per-user 4 --frontends 20 --duration 60
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+import requests
+
+from models import Term, User, Section, Subscription, CatalogEntry, init_db, get_session
+
+SUBJECTS = ["CSCE", "MATH", "STAT", "ECEN", "PBSI", "ENGL", "POLS", "PHYS", "CHEM", "HIST"]
+PROFESSORS = ["Beideman", "Ning", "Crawford", "Tyagi", "Hull", "Anders", "Merchant", "Kebo", "Chupp", "Lee"]
+
+
+def seed_database(db_url: str, users: int, courses_per_user: int, shared_crns: int, seed: int) -> list:
+    """Create a synthetic dataset.
+
+    Users draw their courses from a shared pool of CRNs, so popular sections have many watchers
+    like they do during registration.
+
+    Args:
+        db_url: SQLAlchemy URL of the database to seed
+        users: Number of users to create
+        courses_per_user: Number of courses watched by each user
+        shared_crns: Size of the CRN pool courses are drawn from
+        seed: Random seed, so runs are reproducible
+
+    Returns:
+        list: The catalog entry dicts of the CRN pool
+    """
+    rng = random.Random(seed)
+    engine = init_db(db_url)
+    session = get_session(engine)
+
+    # Build the CRN pool, a few sections per course
+    sections = []
+    for i in range(shared_crns):
+        course_name = f"{SUBJECTS[i % len(SUBJECTS)]} {100 + (i // len(SUBJECTS)) // 3}"
+        sections.append({
+            "course_name": course_name,
+            "professor": rng.choice(PROFESSORS),
+            "crn": str(10000 + i)
+        })
+    # Everything goes into the default term registered by init_db
+    term_id = session.query(Term).first().id
+    session.add_all([CatalogEntry(term_id=term_id, **section) for section in sections])
+    watched = {section["crn"]: Section(term_id=term_id, **section) for section in sections}
+
+    # Skewed popularity: low CRNs are watched far more often than high ones
+    weights = [1 / (rank + 1) for rank in range(len(sections))]
+    for i in range(users):
+        user = User(name=f"Aggie {i:05d}", webhook_url=f"http://127.0.0.1:9/webhooks/{i}")
+        picked = {section["crn"]: section for section in rng.choices(sections, weights, k=courses_per_user)}
+        user.subscriptions = [Subscription(section=watched[crn]) for crn in picked]
+        session.add(user)
+
+    session.commit()
+    session.close()
+    engine.dispose()
+    return sections
+
+
+class Recorder:
+    """Thread-safe collection of request latencies and errors per endpoint."""
+
+    def __init__(self):
+        """Constructor."""
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)  # Maps endpoint labels to latencies in seconds
+        self.errors = defaultdict(int)  # Maps endpoint labels to failed request counts
+        self.rejected = defaultdict(int)  # Maps endpoint labels to counts of expected 4xx responses
+
+    def request(self, session: requests.Session, label: str, method: str, url: str, expected: tuple = (),
+                **kwargs):
+        """Send a request and record its latency under label.
+
+        Args:
+            expected: 4xx status codes the traffic provokes on purpose, counted as rejections instead of errors
+
+        Returns:
+            The response, or None if the request failed to complete
+        """
+        start = time.perf_counter()
+        try:
+            response = session.request(method, url, timeout=30, **kwargs)
+            status = response.status_code
+        except requests.exceptions.RequestException:
+            response = None
+            status = None
+        elapsed = time.perf_counter() - start
+
+        with self.lock:
+            self.latencies[label].append(elapsed)
+            if status in expected:
+                self.rejected[label] += 1
+            elif status is None or status >= 400:
+                self.errors[label] += 1
+        return response
+
+    def report(self, duration: float) -> dict:
+        """Summarize the recorded requests.
+
+        Args:
+            duration: Length of the run in seconds
+
+        Returns:
+            dict: Maps endpoint labels to their request count, throughput, latency, error rate and rejection rate
+        """
+        summary = {}
+        for label, latencies in sorted(self.latencies.items()):
+            latencies = sorted(latencies)
+            summary[label] = {
+                "requests": len(latencies),
+                "rps": len(latencies) / duration,
+                "p50_ms": percentile(latencies, 50) * 1000,
+                "p99_ms": percentile(latencies, 99) * 1000,
+                "error_rate": self.errors[label] / len(latencies),
+                "rejected_rate": self.rejected[label] / len(latencies)
+            }
+        return summary
+
+
+def percentile(sorted_values: list, percent: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def simulate_scraper(base_url: str, recorder: Recorder, stop: threading.Event, interval: float, page_size: int):
+    """Poll the API like main.py does every cycle: the terms, every page of sections, the watch rules,
+    then the settings."""
+    session = requests.Session()
+    while not stop.is_set():
+        recorder.request(session, "GET /terms/", "GET", f"{base_url}/terms/")
+        params = {"limit": page_size}
+        while not stop.is_set():
+            response = recorder.request(session, "GET /sections/", "GET", f"{base_url}/sections/", params=params)
+            cursor = response.headers.get("X-Next-Cursor") if response is not None else None
+            if not cursor:
+                break
+            params["cursor"] = cursor
+
+        recorder.request(session, "GET /rules/", "GET", f"{base_url}/rules/", params={"limit": page_size})
+        recorder.request(session, "GET /settings/", "GET", f"{base_url}/settings/")
+        stop.wait(interval)
+
+
+def simulate_frontend(base_url: str, recorder: Recorder, stop: threading.Event, users: int, sections: list,
+                      think_time: tuple, seed: int):
+    """Behave like an open dashboard: browse and search users, view courses, autocomplete and edit courses."""
+    rng = random.Random(seed)
+    session = requests.Session()
+
+    while not stop.is_set():
+        action = rng.random()
+        user_id = rng.randint(1, users)
+
+        if action < 0.35:
+            params = {"limit": 50, "sort": "name"}
+            if rng.random() < 0.5:
+                params["name"] = f"Aggie {rng.randint(0, users - 1):05d}"[:rng.randint(7, 10)]
+            recorder.request(session, "GET /users/ (frontend)", "GET", f"{base_url}/users/", params=params)
+        elif action < 0.65:
+            recorder.request(session, "GET /users/{user_id}/courses", "GET", f"{base_url}/users/{user_id}/courses")
+        elif action < 0.85:
+            section = rng.choice(sections)
+            field, text = rng.choice([("course_name", section["course_name"]), ("crn", section["crn"])])
+            recorder.request(session, "GET /catalog/search", "GET", f"{base_url}/catalog/search",
+                             params={"q": text[:rng.randint(1, len(text))], "field": field})
+        else:
+            # Add a course, then remove it again so the dataset stays the same size.
+            # The user may already watch the CRN, which the API rejects with a 400
+            section = rng.choice(sections)
+            response = recorder.request(session, "POST /users/{user_id}/courses", "POST",
+                                        f"{base_url}/users/{user_id}/courses", expected=(400,), json=section)
+            if response is not None and response.status_code == 201:
+                course_id = response.json()["id"]
+                recorder.request(session, "DELETE /courses/{course_id}", "DELETE", f"{base_url}/courses/{course_id}")
+
+        stop.wait(rng.uniform(*think_time))
+
+
+def start_api(db_url: str, port: int) -> subprocess.Popen:
+    """Start the API with uvicorn on the seeded database and wait until it answers."""
+    env = dict(os.environ, HOWDYSEEK_DB_URL=db_url)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env
+    )
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("API server exited during startup")
+        try:
+            if requests.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return server
+        except requests.exceptions.RequestException:
+            pass
+        time.sleep(0.2)
+
+    server.terminate()
+    raise RuntimeError("API server did not start within 30 seconds")
+
+
+def print_report(summary: dict):
+    """Print the per-endpoint summary as a table."""
+    print(f"{'endpoint':<36}{'requests':>10}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>9}{'rejected':>10}")
+    for label, stats in summary.items():
+        print(
+            f"{label:<36}{stats['requests']:>10}{stats['rps']:>10.1f}{stats['p50_ms']:>10.1f}"
+            f"{stats['p99_ms']:>10.1f}{stats['error_rate']:>9.1%}{stats['rejected_rate']:>10.1%}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the HowdySeek API with a synthetic dataset")
+    parser.add_argument("--users", type=int, default=1000, help="number of synthetic users")
+    parser.add_argument("--courses-per-user", type=int, default=4, help="courses watched by each user")
+    parser.add_argument("--shared-crns", type=int, default=300, help="size of the CRN pool users draw from")
+    parser.add_argument("--scrapers", type=int, default=1, help="simulated scraper processes")
+    parser.add_argument("--scraper-interval", type=float, default=5.0, help="seconds between scraper cycles")
+    parser.add_argument("--frontends", type=int, default=10, help="simulated open dashboards")
+    parser.add_argument("--think-time", type=float, nargs=2, default=(0.1, 1.0), metavar=("MIN", "MAX"),
+                        help="seconds a dashboard waits between requests")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of traffic to send")
+    parser.add_argument("--page-size", type=int, default=500, help="sections per page fetched by scrapers")
+    parser.add_argument("--port", type=int, default=8765, help="port for the API under test")
+    parser.add_argument("--db", help="SQLite file to seed (default: a temporary file), must not exist yet")
+    parser.add_argument("--force", action="store_true", help="overwrite the --db file if it already exists")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for the dataset and traffic")
+    parser.add_argument("--json", help="also write the summary as JSON to this path")
+    args = parser.parse_args()
+
+    # Never seed over an existing database, it may well be the real howdyseek.db
+    if args.db and os.path.exists(args.db):
+        if not args.force:
+            parser.error(f"{args.db} already exists, pass --force to overwrite it")
+        os.remove(args.db)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = args.db or os.path.join(tmp_dir, "loadtest.db")
+        db_url = f"sqlite:///{db_path}"
+
+        print(f"Seeding {args.users} users x {args.courses_per_user} courses over {args.shared_crns} CRNs...")
+        sections = seed_database(db_url, args.users, args.courses_per_user, args.shared_crns, args.seed)
+
+        server = start_api(db_url, args.port)
+        base_url = f"http://127.0.0.1:{args.port}"
+        recorder = Recorder()
+        stop = threading.Event()
+
+        threads = [
+            threading.Thread(target=simulate_scraper,
+                             args=(base_url, recorder, stop, args.scraper_interval, args.page_size))
+            for _ in range(args.scrapers)
+        ]
+        threads += [
+            threading.Thread(target=simulate_frontend,
+                             args=(base_url, recorder, stop, args.users, sections, args.think_time, args.seed + i))
+            for i in range(args.frontends)
+        ]
+
+        print(f"Driving {args.scrapers} scrapers and {args.frontends} frontends for {args.duration:.0f}s...")
+        try:
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            time.sleep(args.duration)
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+            duration = time.perf_counter() - start
+            server.terminate()
+            server.wait()
+
+    summary = recorder.report(duration)
+    print_report(summary)
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(summary, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
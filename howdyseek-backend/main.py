@@ -3,6 +3,7 @@ HOWDY! SEEK
 """
 
 import random
+import signal
 import time
 import traceback
 import re
@@ -22,25 +23,88 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 # Import configuration from config.py
 from config import (
-    USER_DATA_DIR_ARG, PROFILE_DIR_ARG, TAMU_SCHEDULER_BASE_URL, 
-    FALL_2025_URL, TERM_STRING, API_BASE_URL, INVALID_PAGE_STRING, 
-    DEFAULT_REFRESH_INTERVAL_RANGE
+    USER_DATA_DIR_ARG, PROFILE_DIR_ARG, API_BASE_URL, INVALID_PAGE_STRING,
+    DEFAULT_REFRESH_INTERVAL_RANGE, TAB_TIME_BUDGET, API_PAGE_SIZE, CATALOG_SNAPSHOT_ENABLED,
+    AGENT_MODE, AGENT_LISTENER_PORT, AGENT_STALE_MARGIN, AGENT_HEARTBEAT_POLLS, AGENT_LOAD_TIMEOUT,
+    DEFAULT_REQUESTS_PER_MINUTE
 )
+from agent import AGENT_SCRIPT, AGENT_SET_DELAY_SCRIPT, AGENT_STOP_SCRIPT, SeatEventListener
+from governor import RequestGovernor
+from profiler import CycleProfiler
+from retry_policy import CircuitBreaker, backoff_delay
+from rules import RuleIndex, describe
+from terms import TermPool
 
 # Global tracking variables
-FIRST_TAB_CREATED = False
 KNOWN_EMPTY_SECTIONS = []  # CRNs of courses known to currently have no sections
 
+# Reads the options table in one call: the course name and section page link of every row
+OPTIONS_ROWS_SCRIPT = """
+return Array.from(document.getElementsByClassName('css-131ktj-rowCss')).map(row => {
+    const link = row.querySelector('td:nth-child(3) a');
+    return {text: row.children[1].innerText, href: link ? link.href : null};
+});
+"""
+
+# Finds a course's row in the options table, preferring its indexed position, and clicks its section link
+OPEN_ROW_SCRIPT = """
+const [courseName, position] = arguments;
+const rows = document.getElementsByClassName('css-131ktj-rowCss');
+const matches = (row) => {
+    const match = row && row.children[1] && row.children[1].innerText.trim().match(/^(\\w+ \\d+)/);
+    return Boolean(match) && match[1] === courseName;
+};
+const row = matches(rows[position]) ? rows[position] : Array.from(rows).find(matches);
+const link = row ? row.querySelector('td:nth-child(3) a') : null;
+if (!link) return false;
+link.click();
+return true;
+"""
+
+# Reads the sections table in one call: its header labels and the text of every cell
+SECTIONS_TABLE_SCRIPT = """
+const cell = document.querySelector('.css-1p12g40-cellCss-hideOnMobileCss');
+if (!cell) return null;
+const table = cell.closest('table');
+return {
+    headers: Array.from(table.querySelectorAll('thead th')).map(th => th.innerText.trim()),
+    rows: Array.from(table.querySelectorAll('tbody tr')).map(
+        tr => Array.from(tr.children).map(td => td.innerText.trim())
+    )
+};
+"""
+
 
 class HowdySeek:
     def __init__(self):
         """Constructor."""
-        self.data = self._load_config()
-        self.course_names = {}  # Maps URL ID to course name
-        self.section_states = {}  # Maps course names to {crn: seats} dictionaries
+        self.profiling_enabled = False  # Mirrors the profiling_enabled setting
+        self.requests_per_minute = DEFAULT_REQUESTS_PER_MINUTE  # Mirrors the requests_per_minute setting
+        self.terms = {}  # Maps term IDs to TermPool instances
+        self._load_config()
+        self.first_tab_used = False  # Whether the browser's initial tab has been put to use
+        self.course_names = {}  # Maps URL ID to (term ID, course name)
         self.tab_links = {}  # Maps window handles to URLs
         self.refresh_interval_range = self._load_refresh_settings()
-        self.monitored_courses = set()  # Track which courses are currently being monitored
+        self.breakers = {}  # Maps (term ID, course name) to CircuitBreaker instances
+
+        # Global budget for requests to the scheduler host
+        self.governor = RequestGovernor(self.requests_per_minute)
+
+        # Profiling hooks, enabled through the profiling_enabled setting or toggled with SIGUSR1
+        self.profiler = CycleProfiler()
+        if hasattr(signal, "SIGUSR1"):
+            signal.signal(signal.SIGUSR1, self.profiler.toggle)
+
+        # In-page agents, used instead of WebDriver refreshes when AGENT_MODE is on
+        self.agent_listener = None
+        self.agent_last_seen = {}  # Maps URL IDs to the last time their agent reported, None if it needs a reload
+        self.agent_sections = {}  # Maps URL IDs to {crn: seats} as last reported by their agent
+        self.agent_intervals = {}  # Maps URL IDs to the seconds between polls their agent was given
+        self.agent_stale_after = {}  # Maps URL IDs to the seconds without events after which their agent is silent
+        if AGENT_MODE:
+            self.agent_listener = SeatEventListener(AGENT_LISTENER_PORT)
+            self.agent_listener.start()
 
         # Initialize WebDriver
         self.driver = self._setup_webdriver()
@@ -66,87 +130,181 @@ class HowdySeek:
                 return DEFAULT_REFRESH_INTERVAL_RANGE
 
             settings = response.json()
+            self.profiling_enabled = settings.get('profiling_enabled', False)
+            self.requests_per_minute = settings.get('requests_per_minute', DEFAULT_REQUESTS_PER_MINUTE)
             return (settings['min_refresh_interval'], settings['max_refresh_interval'])
         except Exception as e:
             print(f"Error loading refresh settings from API: {e}")
             traceback.print_exc()
             return DEFAULT_REFRESH_INTERVAL_RANGE
 
-    def _load_config(self) -> dict:
-        """Load configuration from the API. 
-        Format the data to match the original JSON structure for compatibility."""
-        try:
-            # Get all users from the API
-            response = requests.get(f"{API_BASE_URL}/users/")
-            if response.status_code != 200:
-                print(f"Failed to fetch users: {response.text}")
-                return {}
+    @staticmethod
+    def _get_all_pages(path: str) -> list:
+        """Fetch every page of a paginated API endpoint.
 
-            users = response.json()
+        Args:
+            path: The endpoint path, relative to the API base URL
 
-            # Format data to match the original structure
-            config = {}
-            for user in users:
-                # Use webhook_url as the key
-                webhook = user['webhook_url']
-                courses = []
+        Returns:
+            list: All items across pages
 
-                for course in user['courses']:
-                    courses.append({
-                        "prof": course['professor'],
-                        "course": course['course_name'],
-                        "crn": course['crn']
-                    })
+        Raises:
+            requests.exceptions.HTTPError: If a page fails to load
+        """
+        items = []
+        params = {"limit": API_PAGE_SIZE}
 
-                if courses:  # Only add to config if there are courses
-                    config[webhook] = courses
+        while True:
+            response = requests.get(f"{API_BASE_URL}{path}", params=params)
+            response.raise_for_status()
+            items.extend(response.json())
+
+            # Follow the cursor until the last page
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                return items
+            params["cursor"] = cursor
+
+    def _load_config(self):
+        """Load the registered terms, their watched sections and watch rules from the API into the term pools.
+        Each CRN appears once however many users watch it. On failure the previous configuration is kept."""
+        try:
+            try:
+                response = requests.get(f"{API_BASE_URL}/terms/")
+                response.raise_for_status()
+                terms = response.json()
+                sections = self._get_all_pages("/sections/")
+                rules = self._get_all_pages("/rules/")
+            except requests.exceptions.HTTPError as e:
+                print(f"Failed to fetch terms, sections and watch rules: {e.response.text}")
+                return
+
+            # Group the sections by term, dropping the ones nobody is watching anymore
+            config = {term['id']: {} for term in terms}
+            for section in sections:
+                if section['webhook_urls'] and section['term_id'] in config:
+                    config[section['term_id']][section['crn']] = {
+                        "prof": section['professor'],
+                        "course": section['course_name'],
+                        "crn": section['crn'],
+                        "webhooks": section['webhook_urls'],
+                        # Each subscriber is notified with the professor as they entered it
+                        "profs": {
+                            subscriber['webhook_url']: subscriber['professor']
+                            for subscriber in section.get('subscribers', [])
+                        }
+                    }
+
+            rules_by_term = {}
+            for rule in rules:
+                rules_by_term.setdefault(rule['term_id'], []).append(rule)
+
+            for term in terms:
+                pool = self.terms.setdefault(term['id'], TermPool(term['id'], term['name']))
+                pool.name = term['name']
+                pool.active = term['active']
+                pool.data = config[term['id']] if pool.active else {}
+                pool.rules = RuleIndex(rules_by_term.get(term['id'], []) if pool.active else [])
+
+            # Terms deleted through the API stop notifying
+            for term_id in self.terms.keys() - config.keys():
+                self.terms[term_id].active = False
+                self.terms[term_id].data = {}
+                self.terms[term_id].rules = RuleIndex()
 
             # Also refresh the interval settings
             self.refresh_interval_range = self._load_refresh_settings()
-
-            return config
         except Exception as e:
             print(f"Error loading config from API: {e}")
             traceback.print_exc()
-            return {}
 
-    def _get_all_courses(self) -> set:
-        """Extract all unique courses from the current configuration."""
-        courses = set()
-        for webhook, sections in self.data.items():
-            for section in sections:
-                courses.add(section["course"])
-        return courses
+    def _active_terms(self) -> list:
+        """Get the pools of the terms being monitored."""
+        return [term for term in self.terms.values() if term.active]
 
-    def initialize_first_tab(self):
-        """Initialize the first tab with correct term selection.
-        This is called only when the first tab is created."""
-        global FIRST_TAB_CREATED
-        
-        # If first tab already initialized, do nothing
-        if FIRST_TAB_CREATED:
-            return
-        
+    def _navigate(self, url: str):
+        """Load a scheduler page in the current tab once the rate governor allows it."""
+        self.governor.acquire()
+        self.driver.get(url)
+
+    def _course_priorities(self) -> dict:
+        """Get each monitored course's priority: the number of users watching it.
+
+        Returns:
+            dict: Maps (term ID, course name) to a priority of at least 1
+        """
+        watchers = {}
+        for term in self._active_terms():
+            for section in term.data.values():
+                watchers.setdefault(term.course_key(section["course"]), set()).update(section["webhooks"])
+            for course_name in term.rules.courses():
+                watchers.setdefault(term.course_key(course_name), set()).update(term.rules.webhooks(course_name))
+        return {course: len(webhooks) for course, webhooks in watchers.items()}
+
+    def select_term(self, term: TermPool):
+        """Pick a term on the term selection page in the current tab and wait for its course list.
+        The scheduler asks for the term once before its options page can be used.
+
+        Args:
+            term: The term to select
+        """
         # Navigate to the term selection page
-        self.driver.get(FALL_2025_URL)
+        self._navigate(term.options_url)
 
         # Select the correct term
         WebDriverWait(self.driver, 20).until(
-            EC.element_to_be_clickable((By.XPATH, TERM_STRING))
+            EC.element_to_be_clickable((By.XPATH, term.selector_xpath))
         ).click()
 
         # Submit selection
+        self.governor.acquire()
         WebDriverWait(self.driver, 1).until(
             EC.element_to_be_clickable((
                 By.XPATH,
                 '//*[@id="scheduler-app"]/div/main/div/div/div/div[2]/div/div/button/span[2]'
             ))
         ).click()
-        
-        # Mark first tab as created
-        FIRST_TAB_CREATED = True
-        
+
+        # Mark the term as selected
+        term.selected = True
+
         # Wait for course list to load
+        self._wait_for_options_table()
+
+    def _open_options_tab(self, term: TermPool) -> bool:
+        """Load a term's options page, in the browser's initial tab if it's still unused or in a new tab.
+
+        Args:
+            term: The term whose options page to load
+
+        Returns:
+            bool: True if a new tab was opened. A new tab is closed again if the page fails to load
+
+        Raises:
+            Whatever loading the page raised, e.g. TimeoutException for a misspelled term
+        """
+        tab_is_new = self.first_tab_used
+        new_tab = None
+        if tab_is_new:
+            self.driver.switch_to.new_window('tab')
+            new_tab = self.driver.current_window_handle
+        self.first_tab_used = True
+
+        try:
+            if term.selected:
+                self._navigate(term.options_url)
+                self._wait_for_options_table()
+            else:
+                self.select_term(term)
+        except Exception:
+            # Don't leave the tab behind to be refreshed every cycle
+            if new_tab is not None:
+                self._close_tab(new_tab)
+            raise
+        return tab_is_new
+
+    def _wait_for_options_table(self):
+        """Wait for the course list on the options page to load."""
         WebDriverWait(self.driver, 20).until(
             EC.presence_of_element_located((
                 By.XPATH,
@@ -161,210 +319,274 @@ class HowdySeek:
             ))
         )
 
-    def create_tab_for_course(self, course_name: str) -> bool:
+    def _read_options_index(self) -> dict:
+        """Read the options table in the current tab with a single script call.
+
+        Returns:
+            dict: Maps course names to {"row": row position, "href": section page link}
+        """
+        index = {}
+        for position, row in enumerate(self.driver.execute_script(OPTIONS_ROWS_SCRIPT)):
+            # Bug fix: use regex grab the correct course name. new format as of Fall 2025 registration
+            match = re.match(r"(\w+ \d+)", row["text"].strip())
+            if match and match.group(1) not in index:
+                index[match.group(1)] = {"row": position, "href": row["href"]}
+        return index
+
+    def _open_course_from_options(self, term: TermPool, course_name: str, entry: dict) -> bool:
+        """Open a course's sections page from the options page in the current tab.
+
+        Args:
+            term: The term the options page belongs to
+            course_name: The name of the course to open
+            entry: The course's entry in the options index
+
+        Returns:
+            bool: True if the course was opened and is now monitored, False otherwise
+        """
+        # Click on the section button, found by its indexed row position in one script call
+        self.governor.acquire()
+        if not self.driver.execute_script(OPEN_ROW_SCRIPT, course_name, entry["row"]):
+            return False
+
+        # Wait for the page to change from options
+        WebDriverWait(self.driver, 20, poll_frequency=0.1).until(
+            lambda driver: "options" not in driver.current_url
+        )
+
+        # Extract the URL ID and map it to the course
+        current_url = self.driver.current_url
+        self.course_names[self._url_id(current_url)] = term.course_key(course_name)
+
+        # Store current URL in tab_links
+        self.tab_links[self.driver.current_window_handle] = current_url
+
+        # Mark course as monitored
+        term.monitored_courses.add(course_name)
+        return True
+
+    def open_courses(self, term: TermPool, course_names: set) -> set:
+        """Create a browser tab for each course of a term not monitored yet.
+        The options table is scanned once for the whole batch, not once per course.
+
+        Args:
+            term: The term the courses belong to
+            course_names: The names of the courses to open
+
+        Returns:
+            set: The courses that were opened
+        """
+        pending = sorted(course_names - term.monitored_courses)
+        if not pending:
+            return set()
+
+        opened = set()
+        options_tab = None  # Window handle of the options tab not yet turned into a course tab
+        options_tab_is_new = False
+        try:
+            # The options tab (selecting the term first if needed) becomes the first course's tab
+            options_tab_is_new = self._open_options_tab(term)
+            options_tab = self.driver.current_window_handle
+
+            options_index = self._read_options_index()
+
+            for course_name in pending:
+                if course_name not in options_index:
+                    print(f"Course {course_name} not found in scheduler for {term.name}")
+                    continue
+
+                # Every course after an opened one needs its own tab on the options page
+                if options_tab is None:
+                    options_tab_is_new = self._open_options_tab(term)
+                    options_tab = self.driver.current_window_handle
+
+                if self._open_course_from_options(term, course_name, options_index[course_name]):
+                    opened.add(course_name)
+                    options_tab = None
+                else:
+                    # The tab is still on the options page, so the next course reuses it
+                    print(f"Course {course_name} could not be opened from the options page")
+        except Exception as e:
+            print(f"Error creating tabs for {term.name} courses {pending}: {e}")
+            traceback.print_exc()
+        finally:
+            # Don't leave a stray options tab behind to be refreshed every cycle
+            if options_tab is not None and options_tab_is_new:
+                self._close_tab(options_tab)
+
+        return opened
+
+    def _close_tab(self, window_handle: str):
+        """Close a tab and switch to the last remaining one.
+
+        Args:
+            window_handle: The tab's window handle
+        """
+        try:
+            self.driver.switch_to.window(window_handle)
+            self.driver.close()
+        except NoSuchWindowException:
+            pass
+        self.tab_links.pop(window_handle, None)
+        self.driver.switch_to.window(self.driver.window_handles[-1])
+
+    def create_tab_for_course(self, term: TermPool, course_name: str) -> bool:
         """Create a browser tab for a specific course.
         
         Args:
+            term: The term the course belongs to
             course_name: The name of the course to create a tab for
             
         Returns:
             bool: True if tab was created successfully, False otherwise
         """
-        global FIRST_TAB_CREATED
-        
         # Skip if already monitoring this course
-        if course_name in self.monitored_courses:
+        if course_name in term.monitored_courses:
             return True
-            
+
+        return course_name in self.open_courses(term, {course_name})
+
+    def create_tabs(self):
+        """Create browser tabs for each unique course of every monitored term."""
+        for term in self._active_terms():
+            self.open_courses(term, term.courses())
+
+    def check_for_new_courses(self):
+        """Check for new courses and terms added to the configuration and create tabs for them."""
+        # Reload config to get the latest terms and courses
+        self._load_config()
+
+        added = False
+        for term in self._active_terms():
+            # Find courses that aren't being monitored yet, and open them in one batch per term
+            courses_to_add = term.courses() - term.monitored_courses
+            if courses_to_add:
+                self.open_courses(term, courses_to_add)
+                added = True
+
+        # Terms added or resumed since startup need a catalog too
+        self.snapshot_catalogs()
+
+        return added
+
+    def _read_catalog_sections(self, course_name: str) -> list:
+        """Read the sections of the course open in the current tab for the catalog.
+
+        Args:
+            course_name: The name of the course open in the current tab
+
+        Returns:
+            list: Catalog entry dicts for each section, empty if the course has no sections,
+            or None if the page didn't load
+        """
         try:
-            # Always check if first tab needs to be initialized
-            if not FIRST_TAB_CREATED:
-                self.initialize_first_tab()
-                
-                # Look for the course in the list
-                course_elements = self.driver.find_elements(By.CLASS_NAME, 'css-131ktj-rowCss')
-
-                for course_element in course_elements:
-                    # Extract the course name from the element
-                    course = course_element.find_elements(By.XPATH, './*')[1].get_attribute('innerText')
-                    # Bug fix: use regex grab the correct course name. new format as of Fall 2025 registration
-                    match = re.match(r"(\w+ \d+)", course)
-                    course = match.group(1)
-
-                    # Found a matching course with our json, let us designate this tab for that course
-                    if course == course_name:
-                        # Click on the section button
-                        section_button = course_element.find_element(By.XPATH, './td[3]/div/div/div[1]/a')
-                        section_button.click()
-
-                        # Wait for the page to change from options
-                        while "options" in self.driver.current_url:
-                            time.sleep(0.01)
-
-                        # Extract the URL ID and map it to the course name
-                        url_id = self.driver.current_url.split('/')[-1]
-                        self.course_names[url_id] = course_name
-                        
-                        # Store current URL in tab_links
-                        self.tab_links[self.driver.current_window_handle] = self.driver.current_url
-                        
-                        # Mark course as monitored
-                        self.monitored_courses.add(course_name)
-                        return True
-                
-                # If we get here and it's the first tab, but course wasn't found,
-                # still mark the first tab as created, since we'll need to create a new tab anyway
-                return False
-            else:
-                # For subsequent tabs, open a new tab
-                self.driver.switch_to.new_window('tab')
-                self.driver.get(FALL_2025_URL)
-                
-                # Wait for course list to load
-                WebDriverWait(self.driver, 20).until(
-                    EC.presence_of_element_located((
-                        By.XPATH,
-                        '//*[@id="scheduler-app"]/div/main/div/div/div[1]/div/div[4]/div[1]/div[1]/div[1]/div/div[2]'
-                    ))
-                )
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.CLASS_NAME, 'css-1p12g40-cellCss-hideOnMobileCss'))
+            )
+        except TimeoutException:
+            return [] if self.has_no_sections() else None
 
-                WebDriverWait(self.driver, 20).until(
-                    EC.presence_of_element_located((
-                        By.XPATH,
-                        '//*[@id="scheduler-app"]/div/main/div/div/div[2]/div[1]/div/div[2]/table'
-                    ))
-                )
+        return self._parse_sections_table(course_name, self.driver.execute_script(SECTIONS_TABLE_SCRIPT))
 
-                # Look for the course in the list
-                course_elements = self.driver.find_elements(By.CLASS_NAME, 'css-131ktj-rowCss')
-
-            for course_element in course_elements:
-                # Extract the course name from the element
-                course = course_element.find_elements(By.XPATH, './*')[1].get_attribute('innerText')
-                # Bug fix: use regex grab the correct course name. new format as of Fall 2025 registration
-                match = re.match(r"(\w+ \d+)", course)
-                course = match.group(1)
-
-                # Found a matching course with our json, let us designate this tab for that course
-                if course == course_name:
-                    # Click on the section button
-                    section_button = course_element.find_element(By.XPATH, './td[3]/div/div/div[1]/a')
-                    section_button.click()
-
-                    # Wait for the page to change from options
-                    while "options" in self.driver.current_url:
-                        time.sleep(0.01)
-
-                    # Extract the URL ID and map it to the course name
-                    url_id = self.driver.current_url.split('/')[-1]
-                    self.course_names[url_id] = course_name
-                    
-                    # Store current URL in tab_links
-                    self.tab_links[self.driver.current_window_handle] = self.driver.current_url
-                    
-                    # Mark course as monitored
-                    self.monitored_courses.add(course_name)
-                    
-                    return True
-            
-            # If we get here, course wasn't found
-            print(f"Course {course_name} not found in scheduler")
-            return False
-            
-        except Exception as e:
-            print(f"Error creating tab for course {course_name}: {e}")
-            traceback.print_exc()
-            return False
+    @staticmethod
+    def _parse_sections_table(course_name: str, table) -> list:
+        """Turn the result of SECTIONS_TABLE_SCRIPT into catalog entry dicts.
 
-    def create_tabs(self):
-        """Create browser tabs for each unique course in the configuration."""
-        global FIRST_TAB_CREATED
-        
-        # Get all unique courses from config
-        courses = self._get_all_courses()
-        
-        # If no courses, nothing to do
-        if not courses:
+        Args:
+            course_name: The name of the course the table belongs to
+            table: The script's result, None if the page has no sections table
+
+        Returns:
+            list: Catalog entry dicts for each section
+        """
+        if not table:
+            return []
+
+        # Locate columns by header so the professor is picked up if the layout shifts
+        headers = [header.lower() for header in table["headers"]]
+        crn_column = next((i for i, header in enumerate(headers) if "crn" in header), None)
+        professor_column = next((i for i, header in enumerate(headers) if "instructor" in header), None)
+        if crn_column is None:
+            return []
+
+        entries = []
+        for row in table["rows"]:
+            if len(row) <= crn_column or not row[crn_column].isdigit():
+                continue
+            professor = row[professor_column] if professor_column is not None and len(row) > professor_column else ""
+            entries.append({
+                "course_name": course_name,
+                "professor": " ".join(professor.split()),
+                "crn": row[crn_column]
+            })
+        return entries
+
+    def snapshot_catalogs(self):
+        """Snapshot the catalog of every active term without one yet, so the API can validate and autocomplete
+        its courses. A failed snapshot is retried next time."""
+        if not CATALOG_SNAPSHOT_ENABLED:
             return
-            
-        # Create first tab if not already created
-        if not FIRST_TAB_CREATED:
-            # Initialize first tab, regardless of whether we'll use it for a course
-            self.initialize_first_tab()
-            
-            # If we have courses, assign the first one to this tab
-            if courses:
-                first_course = next(iter(courses))
-                
-                # Look for the course in the list
-                course_elements = self.driver.find_elements(By.CLASS_NAME, 'css-131ktj-rowCss')
-
-                for course_element in course_elements:
-                    # Extract the course name from the element
-                    course = course_element.find_elements(By.XPATH, './*')[1].get_attribute('innerText')
-                    # Bug fix: use regex grab the correct course name. new format as of Fall 2025 registration
-                    match = re.match(r"(\w+ \d+)", course)
-                    course = match.group(1)
-
-                    # Found a matching course with our json, let us designate this tab for that course
-                    if course == first_course:
-                        # Click on the section button
-                        section_button = course_element.find_element(By.XPATH, './td[3]/div/div/div[1]/a')
-                        section_button.click()
-
-                        # Wait for the page to change from options
-                        while "options" in self.driver.current_url:
-                            time.sleep(0.01)
-
-                        # Extract the URL ID and map it to the course name
-                        url_id = self.driver.current_url.split('/')[-1]
-                        self.course_names[url_id] = first_course
-                        
-                        # Store current URL in tab_links
-                        self.tab_links[self.driver.current_window_handle] = self.driver.current_url
-                        
-                        # Mark course as monitored
-                        self.monitored_courses.add(first_course)
-                        
-                        # Remove first course so we don't create a new tab for it
-                        courses.remove(first_course)
-                        break
-        
-        # Create tabs for remaining courses using create_tab_for_course
-        # This ensures we handle the first tab initialization if needed
-        for course_name in courses:
-            if course_name not in self.monitored_courses:
-                self.create_tab_for_course(course_name)
 
-    def check_for_new_courses(self):
-        """Check for new courses added to the configuration and create tabs for them."""
-        global FIRST_TAB_CREATED
-        
-        # Reload config to get the latest courses
-        new_data = self._load_config()
-        
-        # Extract all courses from the updated config
-        new_courses = set()
-        for webhook, sections in new_data.items():
-            for section in sections:
-                new_courses.add(section["course"])
-        
-        # Find courses that aren't being monitored yet
-        courses_to_add = new_courses - self.monitored_courses
-        
-        # Update the stored data
-        self.data = new_data
-        
-        # If we have courses to add but first tab isn't created yet, use create_tabs()
-        if courses_to_add and not FIRST_TAB_CREATED:
-            self.create_tabs()
-            return len(courses_to_add) > 0
-            
-        # If first tab already exists, create tabs for new courses
-        for course_name in courses_to_add:
-            self.create_tab_for_course(course_name)
-            
-        return len(courses_to_add) > 0
+        for term in self._active_terms():
+            if not term.catalog_snapshotted:
+                term.catalog_snapshotted = self.snapshot_catalog(term)
+
+    def snapshot_catalog(self, term: TermPool) -> bool:
+        """Snapshot a term's catalog from the options page and sections pages and upload it to the API.
+        Uses a temporary tab so course tabs aren't disturbed.
+
+        Args:
+            term: The term to snapshot
+
+        Returns:
+            bool: True if the snapshot was uploaded
+        """
+        original_handle = self.driver.current_window_handle
+        options_tab = None  # The temporary tab, None while it isn't open or the browser's initial tab is used
+
+        try:
+            if self._open_options_tab(term):
+                options_tab = self.driver.current_window_handle
+
+            courses = {
+                course_name: entry["href"]
+                for course_name, entry in self._read_options_index().items()
+                if entry["href"]
+            }
+
+            entries = []
+            failed = []  # Courses whose sections page didn't load
+            for position, (course_name, link) in enumerate(courses.items()):
+                # Without the governor nothing else spaces out the page loads, so pace them like tab refreshes
+                if position and not self.governor.enabled:
+                    time.sleep(random.uniform(*self.refresh_interval_range))
+
+                self._navigate(link)
+                sections = self._read_catalog_sections(course_name)
+                if sections is None:
+                    failed.append(course_name)
+                else:
+                    entries.extend(sections)
+
+            # Keep the professors around for watch rules on a professor
+            term.professors.update({entry["crn"]: entry["professor"] for entry in entries})
+
+            # A partial snapshot is merged, so the stored rows of courses that failed to load are kept
+            params = {"term_id": term.id, "partial": bool(failed)}
+            response = requests.put(f"{API_BASE_URL}/catalog/", params=params, json=entries)
+            response.raise_for_status()
+            print(f"Catalog snapshot of {term.name}: {len(entries)} sections across {len(courses)} courses")
+            if failed:
+                print(f"Sections pages of {len(failed)} courses did not load, kept their previous catalog rows: {failed}")
+            return True
+        except Exception as e:
+            print(f"Error snapshotting catalog of {term.name}: {e}")
+            traceback.print_exc()
+            return False
+        finally:
+            if options_tab is not None:
+                self._close_tab(options_tab)
+                self.driver.switch_to.window(original_handle)
 
     def redirect_if_invalid(self) -> bool:
         """Check if the current page has an error and redirect if needed.
@@ -373,11 +595,24 @@ class HowdySeek:
             True if a redirect was performed, False otherwise
         """
         if INVALID_PAGE_STRING in self.driver.current_url:
+            self.governor.penalize("invalid.aspx")
             url = self.driver.current_url.replace(INVALID_PAGE_STRING, "")
-            self.driver.get(url)
+            self._navigate(url)
             return True
         return False
 
+    def _page_error(self):
+        """Check the current page for signs that the scheduler is unhappy with us.
+
+        Returns:
+            "invalid request" or "spinner" if the page errored out or is stuck loading, None otherwise
+        """
+        if "invalid request" in self.driver.page_source:
+            return "invalid request"
+        if self.driver.find_elements(By.CLASS_NAME, 'spinner'):
+            return "spinner"
+        return None
+
     def has_no_sections(self) -> bool:
         """Check if the current course has no sections available.
         
@@ -391,36 +626,84 @@ class HowdySeek:
             return text == "Enabled (0 of 0)"
         return False
 
-    def check_sections(self, current_link: str):
+    @staticmethod
+    def _url_id(link: str) -> str:
+        """Get the ID of a course page from its URL. It includes the term, since course IDs may repeat across terms."""
+        return link.split('/terms/')[-1]
+
+    def _course_for_link(self, link: str):
+        """Get the course monitored by a tab.
+
+        Args:
+            link: The URL of the tab
+
+        Returns:
+            The (term ID, course name) tuple, or None if the tab isn't a course tab
+        """
+        return self.course_names.get(self._url_id(link))
+
+    def _get_breaker(self, course: tuple) -> CircuitBreaker:
+        """Get the circuit breaker for a (term ID, course name) tuple, creating it if needed."""
+        if course not in self.breakers:
+            term_id, course_name = course
+            self.breakers[course] = CircuitBreaker(f"{course_name} ({self.terms[term_id].name})")
+        return self.breakers[course]
+
+    def get_breaker_states(self) -> dict:
+        """Get the circuit breaker state of every course for debugging.
+
+        Returns:
+            dict: Maps (term ID, course name) to their breaker state
+        """
+        return {course: breaker.to_dict() for course, breaker in self.breakers.items()}
+
+    def _retry_tab(self, current_link: str, attempt: int, deadline: float) -> bool:
+        """Back off and reload a tab, unless its time budget is used up.
+
+        Args:
+            current_link: The URL of the current tab
+            attempt: Zero-based retry attempt number
+            deadline: time.monotonic() value after which the tab is given up on
+
+        Returns:
+            bool: True if the tab was reloaded, False if the time budget is exhausted
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+
+        time.sleep(min(backoff_delay(attempt), remaining))
+        self._navigate(current_link)
+        return True
+
+    def check_sections(self, current_link: str) -> bool:
         """Check for section availability changes and send notifications.
         
         Args:
             current_link: The URL of the current tab
+
+        Returns:
+            bool: True if the page was read (including when it has no sections),
+            False if it didn't load within the tab's time budget
         """
         # Get the course name corresponding to this URL ID
-        current_url_id = current_link.split('/')[-1]
-        current_course = None
-
-        for url_id, course in self.course_names.items():
-            if url_id == current_url_id:
-                current_course = course
-                break
+        current_course = self._course_for_link(current_link)
 
         # Skip if we can't identify the course (shouldn't ever happen)
         if not current_course:
-            return
-
-        # Initialize section state for this course if it doesn't exist
-        if current_course not in self.section_states:
-            self.section_states[current_course] = {}
+            return True
 
         # Extract visible sections and their availability
         visible_sections = {}
 
         success = False
 
+        # Bound the time spent on this tab so one bad page can't stall every other course
+        deadline = time.monotonic() + TAB_TIME_BUDGET
+        attempt = 0
+
         # Different wait strategy based on whether we expect this course to have sections
-        if current_link.split('/')[-1] in KNOWN_EMPTY_SECTIONS:
+        if self._url_id(current_link) in KNOWN_EMPTY_SECTIONS:
             # Wait #1 is for classes that currently have no sections available in the "Enabled" tab
             # We can assume that they probably still don't have sections so we wait a shorter amount of time for them
             while not success:
@@ -435,17 +718,22 @@ class HowdySeek:
                     # The page may be errored out or there are simply no sections
 
                     # Do error handling before checking if sections are available
-                    if "invalid request" in self.driver.page_source:
-                        # Refresh if invalid request
-                        self.driver.get(current_link)
-                    elif self.driver.find_elements(By.CLASS_NAME, 'spinner'):
-                        # Or refresh if still loading / erroring out
-                        self.driver.get(current_link)
+                    error = self._page_error()
+                    if error:
+                        # Refresh if invalid request, or if still loading / erroring out
+                        self.governor.penalize(error)
+                        if not self._retry_tab(current_link, attempt, deadline):
+                            return False
+                        attempt += 1
 
                     # Check if there are no sections available
                     if self.has_no_sections():
                         # Break and don't toggle success to True
                         break
+
+                    # Give up on this tab once its time budget is used up
+                    if time.monotonic() >= deadline:
+                        return False
         else:
             # Wait #2 is for normal classes with at least one section available
             # Unlike the previous one, we should wait longer for a section element to show up
@@ -465,12 +753,17 @@ class HowdySeek:
                         break
 
                     # Otherwise refresh and retry. Could be a page error or just a timeout
-                    self.driver.get(current_link)
+                    error = self._page_error()
+                    if error:
+                        self.governor.penalize(error)
+                    if not self._retry_tab(current_link, attempt, deadline):
+                        return False
+                    attempt += 1
 
         # At this point, success is True. There are sections to check.
-        # But if it's False, it's because there are no sections available from wait #1. Skip this class.
+        # But if it's False, it's because there are no sections available. Skip this class.
         if not success:
-            return
+            return True
 
         # Extract section information
         try:
@@ -483,54 +776,298 @@ class HowdySeek:
                 seats = int(labels[label + 3].text)
                 visible_sections[crn] = seats
 
+            # Watch rules on a professor need each section's instructor, read in one call when new CRNs show up
+            term_id, course_name = current_course
+            term = self.terms[term_id]
+            if term.rules.needs_professors(course_name) and visible_sections.keys() - term.professors.keys():
+                table = self.driver.execute_script(SECTIONS_TABLE_SCRIPT)
+                for entry in self._parse_sections_table(course_name, table):
+                    term.professors[entry["crn"]] = entry["professor"]
+                for crn in visible_sections:
+                    term.professors.setdefault(crn, "")
+
         except Exception:
-            return
+            return False
 
-        # Process all sections and send notifications for changes
-        for webhook, classes in self.data.items():
-            for section in classes:
-                crn = section["crn"]
+        self._process_sections(current_course, visible_sections)
+        return True
 
-                # Skip if the course doesn't match the current one
-                if section["course"] != current_course:
-                    continue
+    def _process_sections(self, current_course: tuple, visible_sections: dict):
+        """Compare a course's visible sections against the last known state and send notifications.
 
-                # Handle sections that are currently visible
-                if crn in visible_sections:
-                    prev_seats = self.section_states[current_course].get(crn, None)
-                    current_seats = visible_sections[crn]
+        Args:
+            current_course: The (term ID, course name) the sections belong to
+            visible_sections: Maps CRNs to open seats for every section currently shown
+        """
+        term_id, course_name = current_course
+        term = self.terms[term_id]
+
+        # Initialize section state for this course if it doesn't exist
+        states = term.section_states.setdefault(course_name, {})
+        notified = set()  # (webhook, CRN) pairs notified so far
 
-                    # New section or seat change detected
-                    if prev_seats is None or prev_seats != current_seats:
-                        course = section["course"]
-                        prof = section["prof"]
+        # Diff each watched section once, then notify everyone watching it
+        for crn, section in term.data.items():
+            # Skip if the course doesn't match the current one
+            if section["course"] != course_name:
+                continue
 
-                        status = f'Seats Available ({current_seats})' if prev_seats is None else f'Seat Change: {prev_seats} → {current_seats}'
+            course = section["course"]
+            profs = section.get("profs", {})
+
+            # Handle sections that are currently visible
+            if crn in visible_sections:
+                prev_seats = states.get(crn, None)
+                current_seats = visible_sections[crn]
+
+                # New section or seat change detected
+                if prev_seats is None or prev_seats != current_seats:
+                    status = f'Seats Available ({current_seats})' if prev_seats is None else f'Seat Change: {prev_seats} → {current_seats}'
+
+                    for webhook in section["webhooks"]:
                         message = (
-                            f'{course} with {prof} is available.\n'
+                            f'{course} with {profs.get(webhook, section["prof"])} is available.\n'
+                            f'Term: {term.name}\n'
                             f'CRN: {crn}\n'
-                            f'Aggie Schedule Builder: {FALL_2025_URL}'
+                            f'Aggie Schedule Builder: {term.options_url}'
                         )
-
                         self._send_notification(webhook, status, message)
+                        notified.add((webhook, crn))
 
-                        # Update state
-                        self.section_states[current_course][crn] = current_seats
+                    # Update state
+                    states[crn] = current_seats
+
+            # Handle sections that were previously visible but now aren't
+            elif crn in states:
+                # Only notify if previously seats were available
+                if states[crn] > 0:
+                    for webhook in section["webhooks"]:
+                        message = f'{course} with {profs.get(webhook, section["prof"])} is now full.\nTerm: {term.name}\nCRN: {crn}'
+                        self._send_notification(webhook, "Section Full", message)
+                        notified.add((webhook, crn))
 
-                # Handle sections that were previously visible but now aren't
-                elif crn in self.section_states[current_course]:
-                    prev_seats = self.section_states[current_course][crn]
+                # Update state
+                states[crn] = 0
 
-                    # Only notify if previously seats were available
-                    if prev_seats > 0:
-                        course = section["course"]
-                        prof = section["prof"]
+        self._process_rules(term, course_name, visible_sections, notified)
 
-                        message = f'{course} with {prof} is now full.\nCRN: {crn}'
-                        self._send_notification(webhook, "Section Full", message)
+    def _process_rules(self, term: TermPool, course_name: str, visible_sections: dict, notified: set):
+        """Check a course's full section list against its compiled watch rules and notify each rule's owner
+        about sections that started matching, changed seats while matching, or stopped matching.
 
-                    # Update state
-                    self.section_states[current_course][crn] = 0
+        Args:
+            term: The term the course belongs to
+            course_name: The course the sections belong to
+            visible_sections: Maps CRNs to open seats for every section currently shown
+            notified: (webhook, CRN) pairs already notified by CRN subscriptions, so they aren't reported twice
+        """
+        matches = term.rules.match(course_name, visible_sections, term.professors)
+        rule_states = term.rule_states.setdefault(course_name, {})
+
+        for rule_id in matches.keys() | rule_states.keys():
+            rule = term.rules.rules.get(rule_id)
+            if rule is None:  # The rule was deleted
+                del rule_states[rule_id]
+                continue
+
+            webhook = rule["webhook_url"]
+            current = matches.get(rule_id, {})
+            previous = rule_states.get(rule_id, {})
+
+            for crn, current_seats in current.items():
+                prev_seats = previous.get(crn)
+                if prev_seats == current_seats or (webhook, crn) in notified:
+                    continue
+
+                prof = term.professors.get(crn)
+                status = f'Seats Available ({current_seats})' if prev_seats is None else f'Seat Change: {prev_seats} → {current_seats}'
+                message = (
+                    f'{course_name}{f" with {prof}" if prof else ""} is available.\n'
+                    f'Watch rule: {describe(rule)}\n'
+                    f'Term: {term.name}\n'
+                    f'CRN: {crn}\n'
+                    f'Aggie Schedule Builder: {term.options_url}'
+                )
+                self._send_notification(webhook, status, message)
+
+            for crn in previous.keys() - current.keys():
+                if (webhook, crn) in notified:
+                    continue
+
+                status = "Section Full" if visible_sections.get(crn, 0) <= 0 else "Below Minimum Seats"
+                message = f'{course_name} no longer matches {describe(rule)}.\nTerm: {term.name}\nCRN: {crn}'
+                self._send_notification(webhook, status, message)
+
+            # Update state
+            if current:
+                rule_states[rule_id] = current
+            else:
+                rule_states.pop(rule_id, None)
+
+    def _agent_delay_range(self, course: str, priorities: dict) -> tuple:
+        """Get the min/max seconds between an agent's polls.
+        With the rate governor on, each course polls at the rate its share of the budget allows."""
+        if not self.governor.enabled or course not in priorities:
+            return self.refresh_interval_range
+
+        interval = self.governor.interval_for(course, priorities)
+        return (interval * 0.85, interval * 1.15)
+
+    @staticmethod
+    def _agent_stale_after(delay_range: tuple) -> float:
+        """Get the seconds without events after which an agent polling at delay_range counts as silent.
+        An unchanged agent reports every AGENT_HEARTBEAT_POLLS polls, and each poll may wait up to
+        AGENT_LOAD_TIMEOUT for the page to load and again for its sections to show up."""
+        return AGENT_HEARTBEAT_POLLS * (delay_range[1] + 2 * AGENT_LOAD_TIMEOUT) + AGENT_STALE_MARGIN
+
+    def inject_agents(self):
+        """Inject the polling agent into course tabs without a live agent.
+        Tabs whose agent went silent are reloaded first, subject to their circuit breaker.
+        Agents of terms that are no longer active are stopped.
+        Live agents are given a new polling rate when the governor's budget for them changed."""
+        now = time.monotonic()
+        priorities = self._course_priorities()
+
+        for window_handle, link in list(self.tab_links.items()):
+            url_id = self._url_id(link)
+            course = self.course_names.get(url_id)
+            if not course:
+                continue
+
+            last_seen = self.agent_last_seen.get(url_id, 0)
+
+            # Paused and deleted terms send no requests. Their agents are reinjected if the term is resumed
+            if not self.terms[course[0]].active:
+                if last_seen:
+                    self._stop_agent(url_id)
+                    self.agent_last_seen[url_id] = None
+                continue
+
+            breaker = self._get_breaker(course)
+
+            # An agent that stopped reporting counts as one failure, then waits for reinjection
+            if last_seen and now - last_seen > self.agent_stale_after.get(url_id, 0):
+                breaker.record_failure("agent went silent")
+                self.agent_last_seen[url_id] = last_seen = None
+                if breaker.state != "closed":
+                    self._stop_agent(url_id)
+
+            delay_range = self._agent_delay_range(course, priorities)
+
+            try:
+                if last_seen:
+                    # Only touch a live agent when its share of the budget moved noticeably
+                    injected_range = self.agent_intervals.get(url_id)
+                    if injected_range and abs(delay_range[0] - injected_range[0]) > 0.25 * injected_range[0]:
+                        self.driver.switch_to.window(window_handle)
+                        self.driver.execute_script(AGENT_SET_DELAY_SCRIPT, *delay_range)
+                        self.agent_intervals[url_id] = delay_range
+                        # The poll already scheduled still runs at the old rate
+                        self.agent_stale_after[url_id] = max(
+                            self._agent_stale_after(injected_range), self._agent_stale_after(delay_range)
+                        )
+                    continue
+
+                if not breaker.allow():
+                    continue
+
+                self.driver.switch_to.window(window_handle)
+                if last_seen is None:
+                    self._navigate(link)
+
+                self.driver.execute_script(
+                    AGENT_SCRIPT, url_id, link, self.agent_listener.url, self.agent_listener.token,
+                    *delay_range, AGENT_HEARTBEAT_POLLS, AGENT_LOAD_TIMEOUT
+                )
+                self.agent_last_seen[url_id] = now
+                self.agent_intervals[url_id] = delay_range
+                self.agent_stale_after[url_id] = self._agent_stale_after(delay_range)
+            except NoSuchWindowException:
+                del self.tab_links[window_handle]
+            except WebDriverException as e:
+                breaker.record_failure(type(e).__name__)
+                self.agent_last_seen[url_id] = None
+
+    def consume_agent_events(self, duration: float):
+        """Process seat change events from the in-page agents.
+
+        Args:
+            duration: Seconds to keep consuming events before returning
+        """
+        deadline = time.monotonic() + duration
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+
+            event = self.agent_listener.get(remaining)
+            if event is None:
+                return
+
+            try:
+                self._handle_agent_event(event)
+            except Exception:
+                traceback.print_exc()
+
+    def _handle_agent_event(self, event: dict):
+        """Apply one agent event: an error, a heartbeat, or seat changes for a course.
+
+        Args:
+            event: The event posted by the agent
+        """
+        url_id = event.get("course_id")
+        course = self.course_names.get(url_id)
+        if not course:
+            return
+
+        self.agent_last_seen[url_id] = time.monotonic()
+        breaker = self._get_breaker(course)
+
+        if "error" in event:
+            breaker.record_failure(event["error"])
+            if event["error"] in ("invalid page", "invalid request", "spinner"):
+                self.governor.penalize(f"agent: {event['error']}")
+            # Stop the agent while the breaker sidelines the course, the tab and its agent are reloaded
+            # once the breaker lets it be probed again
+            if breaker.state != "closed":
+                self.agent_last_seen[url_id] = None
+                self._stop_agent(url_id)
+            return
+
+        breaker.record_success()
+        self.governor.reward()
+        if "changes" not in event:
+            return
+
+        # Rebuild the full list of visible sections from the deltas
+        visible_sections = self.agent_sections.setdefault(url_id, {})
+        if event.get("full"):
+            visible_sections.clear()
+        for crn, seats in event["changes"].items():
+            if seats is None:
+                visible_sections.pop(crn, None)
+            else:
+                visible_sections[crn] = seats
+
+        self._process_sections(course, dict(visible_sections))
+
+    def _stop_agent(self, url_id: str):
+        """Stop the agent polling a course tab, so a sidelined course sends no more requests.
+
+        Args:
+            url_id: The URL ID of the course tab
+        """
+        for window_handle, link in list(self.tab_links.items()):
+            if self._url_id(link) != url_id:
+                continue
+            try:
+                self.driver.switch_to.window(window_handle)
+                self.driver.execute_script(AGENT_STOP_SCRIPT)
+            except NoSuchWindowException:
+                del self.tab_links[window_handle]
+            except WebDriverException:
+                traceback.print_exc()
 
     @staticmethod
     def _send_notification(webhook: str, title: str, description: str):
@@ -555,44 +1092,137 @@ class HowdySeek:
         """Run the course monitoring loop"""
         # Initial tab creation
         self.create_tabs()
-        
+
+        # Snapshot each term's catalog once so the API can validate and autocomplete courses
+        self.snapshot_catalogs()
+
+        cycle = 0
         while True:
+            cycle += 1
+            self.profiler.requested = self.profiling_enabled
+            self.profiler.start_cycle(self.driver)
+            self.governor.set_rate(self.requests_per_minute)
+
             # Check for new courses every cycle
             self.check_for_new_courses()
 
-            for window_handle in self.driver.window_handles:
-                try:
-                    self.driver.switch_to.window(window_handle)
+            refreshed = 0
+            if AGENT_MODE:
+                # Agents poll on their own, only tabs without a live agent need WebDriver
+                self.inject_agents()
+            else:
+                refreshed = self.poll_tabs()
 
-                    # Skip invalid pages
-                    if "offscreen_compiled.js" in self.driver.page_source:
-                        continue
+            # Print sidelined courses so a stuck tab is visible from the console
+            open_breakers = [state for state in self.get_breaker_states().values() if state["state"] != "closed"]
+            if open_breakers:
+                print(f"Circuit breakers: {open_breakers}")
 
-                    # Store the URL if not already stored
-                    if window_handle not in self.tab_links:
-                        self.tab_links[window_handle] = self.driver.current_url
+            self.profiler.end_cycle(cycle)
 
-                    current_link = self.tab_links[window_handle]
+            if AGENT_MODE:
+                # Consume seat changes pushed by the agents until the next cycle
+                self.consume_agent_events(random.uniform(*self.refresh_interval_range))
+            elif not self.governor.enabled or not refreshed:
+                # Sleep for a random interval using current settings
+                time.sleep(random.uniform(*self.refresh_interval_range))
+            # Otherwise the governor's token bucket paces the refreshes instead of a global sleep
 
-                    # Check for invalid page and redirect if needed
-                    if not self.redirect_if_invalid():
-                        self.driver.refresh()
+    def poll_tabs(self):
+        """Refresh course tabs through WebDriver and check them for section changes.
+        With the rate governor on, course tabs are refreshed in proportion to their priority;
+        otherwise every tab is refreshed once. Tabs of terms that are no longer active are skipped.
 
-                    # Check for section changes
-                    self.check_sections(current_link)
+        Returns:
+            int: Number of tabs visited
+        """
+        window_handles = self.driver.window_handles
+        if self.governor.enabled:
+            window_handles = self._plan_tabs(window_handles)
+
+        for window_handle in window_handles:
+            self._poll_tab(window_handle)
+        return len(window_handles)
+
+    def _plan_tabs(self, window_handles: list) -> list:
+        """Order course tabs for one cycle by priority, leaving out tabs sidelined by their breaker.
+
+        Args:
+            window_handles: The open window handles
 
-                except NoSuchWindowException:
-                    # Remove this handle from our tracking
-                    if window_handle in self.tab_links:
-                        del self.tab_links[window_handle]
-                except WebDriverException:
-                    pass
-                except Exception:
-                    traceback.print_exc()
-                    pass
+        Returns:
+            list: Window handles to refresh this cycle, in order, possibly repeated
+        """
+        handles_by_course = {}
+        for window_handle in window_handles:
+            course = self._course_for_link(self.tab_links.get(window_handle, ""))
+            if course:
+                handles_by_course[course] = window_handle
+
+        priorities = {
+            course: priority
+            for course, priority in self._course_priorities().items()
+            if course in handles_by_course and self._get_breaker(course).allow()
+        }
 
-            # Sleep for a random interval using current settings
-            time.sleep(random.uniform(*self.refresh_interval_range))
+        plan = self.governor.plan(priorities, len(handles_by_course))
+        return [handles_by_course[course] for course in plan]
+
+    def _poll_tab(self, window_handle: str):
+        """Refresh one tab and check it for section changes.
+
+        Args:
+            window_handle: The tab's window handle
+        """
+        breaker = None
+        try:
+            self.driver.switch_to.window(window_handle)
+
+            # Skip invalid pages
+            if "offscreen_compiled.js" in self.driver.page_source:
+                return
+
+            # Store the URL if not already stored
+            if window_handle not in self.tab_links:
+                self.tab_links[window_handle] = self.driver.current_url
+
+            current_link = self.tab_links[window_handle]
+            current_course = self._course_for_link(current_link)
+
+            # Leave the tabs of paused and deleted terms alone
+            if current_course and not self.terms[current_course[0]].active:
+                return
+
+            breaker = self._get_breaker(current_course) if current_course else None
+
+            # Skip tabs sidelined by their circuit breaker until it's time to probe them again
+            if breaker and not breaker.allow():
+                return
+
+            # Check for invalid page and redirect if needed
+            if not self.redirect_if_invalid():
+                self.governor.acquire()
+                self.driver.refresh()
+
+            # Check for section changes
+            if self.check_sections(current_link):
+                self.governor.reward()
+                if breaker:
+                    breaker.record_success()
+            elif breaker:
+                breaker.record_failure("page did not load within the time budget")
+
+        except NoSuchWindowException:
+            # Remove this handle from our tracking
+            if window_handle in self.tab_links:
+                del self.tab_links[window_handle]
+        except WebDriverException as e:
+            if breaker:
+                breaker.record_failure(type(e).__name__)
+        except Exception as e:
+            traceback.print_exc()
+            if breaker:
+                breaker.record_failure(repr(e))
 
 
 if __name__ == "__main__":
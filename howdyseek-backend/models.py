@@ -1,7 +1,13 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, create_engine, Float
+from sqlalchemy import (
+    Column, Integer, String, ForeignKey, MetaData, create_engine, Float, Index, Boolean, UniqueConstraint, func,
+    inspect, text
+)
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.orm import relationship, sessionmaker
 
+from config import DEFAULT_TERM
+
 Base = declarative_base()
 
 
@@ -11,12 +17,32 @@ class Settings(Base):
     id = Column(Integer, primary_key=True)
     min_refresh_interval = Column(Float, default=30.0)
     max_refresh_interval = Column(Float, default=40.0)
+    profiling_enabled = Column(Boolean, nullable=False, default=False)
+    requests_per_minute = Column(Float, nullable=False, default=0.0)  # Off unless set, so upgrades keep their traffic
 
     def to_dict(self):
         return {
             "id": self.id,
             "min_refresh_interval": self.min_refresh_interval,
-            "max_refresh_interval": self.max_refresh_interval
+            "max_refresh_interval": self.max_refresh_interval,
+            "profiling_enabled": self.profiling_enabled,
+            "requests_per_minute": self.requests_per_minute
+        }
+
+
+class Term(Base):
+    """A term and campus to monitor, named as on the scheduler's term selection page"""
+    __tablename__ = 'terms'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100), nullable=False, unique=True)  # e.g. "Fall 2025 - College Station"
+    active = Column(Boolean, nullable=False, default=True)
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "name": self.name,
+            "active": self.active
         }
 
 
@@ -27,46 +53,307 @@ class User(Base):
     name = Column(String(100))
     webhook_url = Column(String(255), unique=True, nullable=False)
 
-    # Relationship to courses
-    courses = relationship("Course", back_populates="user", cascade="all, delete-orphan")
+    # Relationships to the sections the user is subscribed to and the user's watch rules
+    subscriptions = relationship("Subscription", back_populates="user", cascade="all, delete-orphan")
+    watch_rules = relationship("WatchRule", back_populates="user", cascade="all, delete-orphan")
+
+    # Case-insensitive name index for name search and name-ordered keyset pagination
+    __table_args__ = (
+        Index('ix_users_name_lower', func.lower(name), id),
+    )
+
+    @property
+    def courses(self):
+        """The user's subscriptions, which the API still presents as courses"""
+        return self.subscriptions
 
     def to_dict(self):
         return {
             "id": self.id,
             "name": self.name,
             "webhook_url": self.webhook_url,
-            "courses": [course.to_dict() for course in self.courses]
+            "courses": [subscription.to_dict() for subscription in self.subscriptions]
         }
 
 
-class Course(Base):
-    __tablename__ = 'courses'
+class Section(Base):
+    """A section watched by at least one user. Each CRN of a term is stored, scraped and diffed once."""
+    __tablename__ = 'sections'
 
     id = Column(Integer, primary_key=True)
+    term_id = Column(Integer, ForeignKey('terms.id'), nullable=False)
     course_name = Column(String(100), nullable=False)
     professor = Column(String(100), nullable=False)
     crn = Column(String(20), nullable=False)
 
-    # Foreign key to User
+    # Relationships to the term and the users subscribed to this section
+    term = relationship("Term")
+    subscriptions = relationship("Subscription", back_populates="section", cascade="all, delete-orphan")
+
+    # CRNs are only unique within a term. Index for course name search
+    __table_args__ = (
+        UniqueConstraint(term_id, crn, name='uq_sections_term_id_crn'),
+        Index('ix_sections_course_name_lower', func.lower(course_name)),
+    )
+
+    @property
+    def webhook_urls(self):
+        """Webhook URLs of every subscribed user"""
+        return [subscription.user.webhook_url for subscription in self.subscriptions]
+
+    @property
+    def subscribers(self):
+        """Webhook URL and professor text of every subscribed user, so each is notified in their own words"""
+        return [
+            {"webhook_url": subscription.user.webhook_url, "professor": subscription.professor}
+            for subscription in self.subscriptions
+        ]
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "term_id": self.term_id,
+            "course_name": self.course_name,
+            "professor": self.professor,
+            "crn": self.crn,
+            "webhook_urls": self.webhook_urls,
+            "subscribers": self.subscribers
+        }
+
+
+class Subscription(Base):
+    """A user watching a section. Presented by the API in the shape of the old per-user course rows."""
+    __tablename__ = 'subscriptions'
+
+    id = Column(Integer, primary_key=True)
+
+    # Foreign keys to User and Section
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    section_id = Column(Integer, ForeignKey('sections.id'), nullable=False)
+
+    # The professor as this user entered it, None to show the section's
+    user_professor = Column('professor', String(100), nullable=True)
+
+    # Relationships to User and Section
+    user = relationship("User", back_populates="subscriptions")
+    section = relationship("Section", back_populates="subscriptions")
+
+    # One subscription per user per section, and an index for fanning out to a section's subscribers
+    __table_args__ = (
+        UniqueConstraint(user_id, section_id, name='uq_subscriptions_user_id_section_id'),
+        Index('ix_subscriptions_section_id', section_id),
+    )
+
+    @property
+    def course_name(self):
+        return self.section.course_name
+
+    @property
+    def professor(self):
+        return self.user_professor if self.user_professor is not None else self.section.professor
 
-    # Relationship to User
-    user = relationship("User", back_populates="courses")
+    @property
+    def crn(self):
+        return self.section.crn
+
+    @property
+    def term_id(self):
+        return self.section.term_id
 
     def to_dict(self):
         return {
             "id": self.id,
+            "term_id": self.term_id,
             "course_name": self.course_name,
             "professor": self.professor,
             "crn": self.crn
         }
 
 
+class WatchRule(Base):
+    """A user watching every section of a course, optionally only a professor's and only with enough open seats"""
+    __tablename__ = 'watch_rules'
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    term_id = Column(Integer, ForeignKey('terms.id'), nullable=False)
+    course_name = Column(String(100), nullable=False)
+    professor = Column(String(100), nullable=True)  # Matches whole words of the listed instructor, None for any
+    min_seats = Column(Integer, nullable=False, default=1)
+
+    # Relationships to User and Term
+    user = relationship("User", back_populates="watch_rules")
+    term = relationship("Term")
+
+    # Indexes for listing a user's rules and a term's rules by course
+    __table_args__ = (
+        Index('ix_watch_rules_user_id', user_id),
+        Index('ix_watch_rules_term_id_course_name', term_id, course_name),
+    )
+
+    @property
+    def webhook_url(self):
+        return self.user.webhook_url
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "term_id": self.term_id,
+            "course_name": self.course_name,
+            "professor": self.professor,
+            "min_seats": self.min_seats,
+            "webhook_url": self.webhook_url
+        }
+
+
+class CatalogEntry(Base):
+    """A section in a term's catalog, as snapshotted by the scraper"""
+    __tablename__ = 'catalog'
+
+    id = Column(Integer, primary_key=True)
+    term_id = Column(Integer, ForeignKey('terms.id'), nullable=False)
+    course_name = Column(String(100), nullable=False)
+    professor = Column(String(100), nullable=False, default="")
+    crn = Column(String(20), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(term_id, crn, name='uq_catalog_term_id_crn'),
+    )
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "term_id": self.term_id,
+            "course_name": self.course_name,
+            "professor": self.professor,
+            "crn": self.crn
+        }
+
+
+def _sql_literal(value) -> str:
+    """Render a column default as an SQL literal for ALTER TABLE"""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (int, float)):
+        return str(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _add_missing_columns(engine):
+    """Add columns introduced after an existing database was created.
+    create_all only creates missing tables, not missing columns."""
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+
+                column_type = column.type.compile(dialect=engine.dialect)
+                default = ""
+                if column.default is not None and column.default.is_scalar:
+                    default = f" DEFAULT {_sql_literal(column.default.arg)}"
+                elif not column.nullable:
+                    raise RuntimeError(f"Cannot add NOT NULL column {table.name}.{column.name} without a default")
+                connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}{default}"))
+
+
+def _ensure_default_term(engine) -> int:
+    """Register DEFAULT_TERM if no term is registered yet.
+
+    Returns:
+        int: The ID of the oldest registered term, which rows from before terms existed belong to
+    """
+    with engine.begin() as connection:
+        term_id = connection.execute(text("SELECT MIN(id) FROM terms")).scalar()
+        if term_id is None:
+            connection.execute(Term.__table__.insert().values(name=DEFAULT_TERM, active=True))
+            term_id = connection.execute(text("SELECT MIN(id) FROM terms")).scalar()
+    return term_id
+
+
+def _add_term_column(engine, table, term_id: int):
+    """Rebuild a table created before terms existed, assigning its rows to a term.
+    The table is copied because SQLite can't add a NOT NULL foreign key or change a unique constraint in place."""
+    inspector = inspect(engine)
+    if not inspector.has_table(table.name):
+        return
+    columns = [column["name"] for column in inspector.get_columns(table.name)]
+    if "term_id" in columns:
+        return
+
+    # Copy the table definition under a temporary name. Its indexes are added back by init_db after the rename
+    metadata = MetaData()
+    Term.__table__.to_metadata(metadata)
+    staging = table.to_metadata(metadata, name=f"{table.name}_staging")
+    staging.indexes.clear()
+
+    column_list = ", ".join(columns)
+    with engine.begin() as connection:
+        staging.create(connection)
+        connection.execute(
+            text(f"INSERT INTO {staging.name} (term_id, {column_list}) SELECT :term_id, {column_list} FROM {table.name}"),
+            {"term_id": term_id}
+        )
+        connection.execute(text(f"DROP TABLE {table.name}"))
+        connection.execute(text(f"ALTER TABLE {staging.name} RENAME TO {table.name}"))
+
+
+def _migrate_courses_to_subscriptions(engine, term_id: int):
+    """Move rows from the old per-user courses table into shared sections and subscriptions.
+    Subscriptions keep the old course IDs and each user's professor text, so existing clients can still delete
+    them by ID. The old table is kept as courses_backup."""
+    if not inspect(engine).has_table('courses'):
+        return
+
+    with engine.begin() as connection:
+        # One section per CRN, named after its oldest course row
+        connection.execute(text("""
+            INSERT INTO sections (term_id, course_name, professor, crn)
+            SELECT :term_id, course_name, professor, crn FROM courses
+            WHERE id IN (SELECT MIN(id) FROM courses GROUP BY crn)
+            AND crn NOT IN (SELECT crn FROM sections WHERE term_id = :term_id)
+        """), {"term_id": term_id})
+        connection.execute(text("""
+            INSERT INTO subscriptions (id, user_id, section_id, professor)
+            SELECT courses.id, courses.user_id, sections.id, courses.professor FROM courses
+            JOIN sections ON sections.crn = courses.crn AND sections.term_id = :term_id
+            WHERE courses.id IN (SELECT MIN(id) FROM courses GROUP BY user_id, crn)
+        """), {"term_id": term_id})
+
+        # Keep the old rows around instead of dropping them
+        backup_name = 'courses_backup'
+        existing_tables = set(inspect(connection).get_table_names())
+        suffix = 1
+        while backup_name in existing_tables:
+            suffix += 1
+            backup_name = f'courses_backup_{suffix}'
+        connection.execute(text(f"ALTER TABLE courses RENAME TO {backup_name}"))
+
+
 def init_db(db_url="sqlite:///howdyseek.db"):
     """Initialize the database with tables"""
     engine = create_engine(db_url)
     Base.metadata.create_all(engine)
 
+    # Rows from before terms existed belong to the first registered term
+    default_term_id = _ensure_default_term(engine)
+    for table in (Section.__table__, CatalogEntry.__table__):
+        _add_term_column(engine, table, default_term_id)
+
+    _add_missing_columns(engine)
+    _migrate_courses_to_subscriptions(engine, default_term_id)
+
+    # create_all skips indexes on tables that already exist, so add any missing ones
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                connection.execute(CreateIndex(index, if_not_exists=True))
+
     # Create default settings if they don't exist
     Session = sessionmaker(bind=engine)
     session = Session()
@@ -0,0 +1,185 @@
+"""
+On-demand sampling profiler for the monitoring loop
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+from config import PROFILE_DIR, PROFILE_KEEP, PROFILE_SAMPLE_INTERVAL, PROFILE_TOP_N
+
+
+class CycleProfiler:
+    """Samples the monitoring thread's stack and times WebDriver commands, one profile per cycle.
+
+    Profiling is switched on by the settings flag or toggled by a signal. While it is off,
+    start_cycle and end_cycle only check a flag, and no thread or wrapper is installed.
+    """
+
+    def __init__(self, directory: str = PROFILE_DIR, keep: int = PROFILE_KEEP,
+                 interval: float = PROFILE_SAMPLE_INTERVAL):
+        """Constructor.
+
+        Args:
+            directory: Where cycle profiles are written
+            keep: Number of cycle profiles kept on disk before the oldest are removed
+            interval: Seconds between stack samples
+        """
+        self.directory = directory
+        self.keep = keep
+        self.interval = interval
+        self.requested = False  # Set from the profiling_enabled setting
+        self.toggled = False  # Flipped by a signal
+
+        # Per-cycle state, only populated while a cycle is being profiled
+        self.active = False
+        self.driver = None
+        self.target_thread_id = None
+        self.sampler = None
+        self.stop_sampling = threading.Event()
+        self.stacks = Counter()  # Maps stacks, outermost frame first, to sample counts
+        self.webdriver_calls = {}  # Maps WebDriver commands to [count, total seconds]
+        self.cycle_start = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the next cycle should be profiled."""
+        return self.requested != self.toggled
+
+    def toggle(self, *_):
+        """Switch profiling on or off. Usable directly as a signal handler."""
+        self.toggled = not self.toggled
+        print(f"Profiling {'enabled' if self.enabled else 'disabled'}")
+
+    def start_cycle(self, driver):
+        """Start profiling a cycle if profiling is enabled.
+
+        Args:
+            driver: The WebDriver whose commands should be timed
+        """
+        if not self.enabled:
+            return
+
+        self.active = True
+        self.driver = driver
+        self.target_thread_id = threading.get_ident()
+        self.stacks = Counter()
+        self.webdriver_calls = {}
+        self.cycle_start = time.perf_counter()
+
+        # Every WebDriver call goes through execute, so wrapping it on the instance catches them all
+        original_execute = driver.execute
+
+        def timed_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return original_execute(driver_command, params)
+            finally:
+                stats = self.webdriver_calls.setdefault(driver_command, [0, 0.0])
+                stats[0] += 1
+                stats[1] += time.perf_counter() - start
+
+        driver.execute = timed_execute
+
+        self.stop_sampling.clear()
+        self.sampler = threading.Thread(target=self._sample, daemon=True)
+        self.sampler.start()
+
+    def _sample(self):
+        """Record the monitoring thread's stack until the cycle ends."""
+        while not self.stop_sampling.wait(self.interval):
+            frame = sys._current_frames().get(self.target_thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.stacks[tuple(reversed(stack))] += 1
+
+    def end_cycle(self, cycle: int):
+        """Stop profiling the current cycle, write its profile to disk and print a summary.
+
+        Args:
+            cycle: The cycle number, used in the profile file name
+        """
+        if not self.active:
+            return
+
+        self.stop_sampling.set()
+        self.sampler.join()
+        del self.driver.execute  # Restore the class method
+        self.active = False
+
+        summary = self._summarize(time.perf_counter() - self.cycle_start)
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            name = f"cycle-{time.strftime('%Y%m%d-%H%M%S')}-{cycle:06d}"
+
+            with open(os.path.join(self.directory, f"{name}.json"), "w") as file:
+                json.dump(summary, file, indent=2)
+
+            # Collapsed stacks, loadable by flame graph tools
+            with open(os.path.join(self.directory, f"{name}.folded"), "w") as file:
+                for stack, count in self.stacks.items():
+                    file.write(f"{';'.join(stack)} {count}\n")
+
+            self._rotate()
+        except OSError as e:
+            print(f"Error writing profile: {e}")
+
+        top = ", ".join(f"{entry['function']} {entry['percent']:.0f}%" for entry in summary["top_functions"][:5])
+        calls = sum(entry["calls"] for entry in summary["webdriver_calls"])
+        print(f"Cycle {cycle} profile: {summary['duration']:.1f}s, {calls} WebDriver calls, top: {top}")
+
+    def _summarize(self, duration: float) -> dict:
+        """Build the cycle summary: top functions by inclusive samples and WebDriver command timings."""
+        total = sum(self.stacks.values())
+        inclusive = Counter()
+        exclusive = Counter()
+        for stack, count in self.stacks.items():
+            exclusive[stack[-1]] += count
+            for function in set(stack):
+                inclusive[function] += count
+
+        top_functions = [
+            {
+                "function": function,
+                "percent": 100 * count / total,
+                "self_percent": 100 * exclusive[function] / total
+            }
+            for function, count in inclusive.most_common(PROFILE_TOP_N)
+        ]
+
+        webdriver_calls = sorted(
+            (
+                {"command": command, "calls": calls, "seconds": seconds}
+                for command, (calls, seconds) in self.webdriver_calls.items()
+            ),
+            key=lambda entry: entry["seconds"],
+            reverse=True
+        )
+
+        return {
+            "duration": duration,
+            "samples": total,
+            "top_functions": top_functions,
+            "webdriver_calls": webdriver_calls
+        }
+
+    def _rotate(self):
+        """Remove the oldest cycle profiles beyond the number to keep."""
+        names = sorted({
+            os.path.splitext(file_name)[0]
+            for file_name in os.listdir(self.directory)
+            if file_name.startswith("cycle-")
+        })
+        for name in names[:-self.keep]:
+            for extension in (".json", ".folded"):
+                path = os.path.join(self.directory, name + extension)
+                if os.path.exists(path):
+                    os.remove(path)
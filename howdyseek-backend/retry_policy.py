@@ -0,0 +1,106 @@
+"""
+Retry policy for course tabs: exponential backoff with jitter and per-course circuit breakers
+"""
+
+import random
+import time
+
+from config import (
+    BACKOFF_BASE_DELAY, BACKOFF_MAX_DELAY, BREAKER_FAILURE_THRESHOLD,
+    BREAKER_COOLDOWN, BREAKER_MAX_COOLDOWN
+)
+
+# Circuit breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE_DELAY, cap: float = BACKOFF_MAX_DELAY) -> float:
+    """Compute a retry delay using exponential backoff with full jitter.
+
+    Args:
+        attempt: Zero-based retry attempt number
+        base: Delay for the first retry
+        cap: Upper bound for the delay
+
+    Returns:
+        float: Seconds to wait before the next retry
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """Sidelines a course tab after repeated failures and probes it again after a cooldown.
+
+    Closed: the tab is checked every cycle.
+    Open: the tab is skipped until the cooldown expires.
+    Half open: a single probe is allowed; success closes the breaker, failure reopens it
+    with a longer cooldown.
+    """
+
+    def __init__(self, course_name: str):
+        """Constructor."""
+        self.course_name = course_name
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.trips = 0  # Number of consecutive times the breaker opened without recovering
+        self.opened_at = None
+        self.cooldown = BREAKER_COOLDOWN
+        self.last_error = None
+
+    def allow(self) -> bool:
+        """Check whether the tab may be checked right now.
+
+        Returns:
+            bool: True if the tab should be checked, False if it is sidelined
+        """
+        if self.state == OPEN:
+            if time.monotonic() - self.opened_at < self.cooldown:
+                return False
+            # Cooldown expired, let a single probe through
+            self.state = HALF_OPEN
+        return True
+
+    def record_success(self):
+        """Record a successful check and close the breaker."""
+        if self.state != CLOSED:
+            print(f"Circuit breaker for {self.course_name} closed")
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.trips = 0
+        self.opened_at = None
+        self.cooldown = BREAKER_COOLDOWN
+        self.last_error = None
+
+    def record_failure(self, error: str = None):
+        """Record a failed check, opening the breaker if the threshold is reached.
+
+        Args:
+            error: Optional description of the failure, kept for debugging
+        """
+        self.consecutive_failures += 1
+        self.last_error = error
+
+        if self.state == HALF_OPEN or self.consecutive_failures >= BREAKER_FAILURE_THRESHOLD:
+            self.trips += 1
+            self.cooldown = min(BREAKER_MAX_COOLDOWN, BREAKER_COOLDOWN * (2 ** (self.trips - 1)))
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+            print(f"Circuit breaker for {self.course_name} opened for {self.cooldown:.0f}s ({error})")
+
+    def to_dict(self) -> dict:
+        """Return the breaker state for debugging."""
+        retry_in = None
+        if self.state == OPEN:
+            retry_in = max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+
+        return {
+            "course_name": self.course_name,
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "trips": self.trips,
+            "cooldown": self.cooldown,
+            "retry_in": retry_in,
+            "last_error": self.last_error
+        }
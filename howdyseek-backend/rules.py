@@ -0,0 +1,112 @@
+"""
+Watch rules: subscriptions to any section of a course taught by a professor or with enough open seats,
+compiled into an index that is checked once against each parsed section list
+"""
+
+import re
+from bisect import bisect_right
+
+from catalog import normalize
+
+
+def name_tokens(text: str) -> frozenset:
+    """Split a professor's name into lowercase words, e.g. "Lee, Sang Rae" into {"lee", "sang", "rae"}."""
+    return frozenset(re.findall(r"\w+", text.lower()))
+
+
+def professor_matches(rule_tokens: frozenset, section_tokens: frozenset) -> bool:
+    """Check whether every word of a rule's professor is a word of the listed instructor.
+    A single letter stands for an initial, so "S Lee" matches "Lee, Sang Rae" but "Lee" doesn't match "Ashlee"."""
+    return all(
+        token in section_tokens or (len(token) == 1 and any(word.startswith(token) for word in section_tokens))
+        for token in rule_tokens
+    )
+
+
+def describe(rule: dict) -> str:
+    """Describe a watch rule for notifications, e.g. "CSCE 314 with Lee, at least 2 seats"."""
+    text = f"{rule['course_name']} with {rule['professor']}" if rule["professor"] else f"any {rule['course_name']} section"
+    if rule["min_seats"] > 1:
+        text += f", at least {rule['min_seats']} seats"
+    return text
+
+
+class RuleIndex:
+    """Watch rules of one term compiled for matching.
+
+    Rules are bucketed by course, then by normalized professor ("" for any professor), and each bucket
+    is sorted by minimum seats so the rules a section satisfies are a prefix found with binary search.
+    Matching a course costs one lookup per section and distinct professor in its rules, however many
+    rules or CRNs the watchers would otherwise have listed.
+    """
+
+    def __init__(self, rules: list = None):
+        """Constructor.
+
+        Args:
+            rules: List of rule dicts with id, course_name, professor, min_seats and webhook_url keys
+        """
+        self.rules = {}  # Maps rule ids to rule dicts
+        self.by_course = {}  # Maps course names to {professor: (sorted min seats, rule ids in the same order)}
+        self.professor_tokens = {}  # Maps normalized rule professors to their words
+        self.build(rules or [])
+
+    def build(self, rules: list):
+        """Rebuild the index from a list of rule dicts."""
+        self.rules = {rule["id"]: rule for rule in rules}
+
+        buckets = {}
+        for rule in rules:
+            professor = normalize(rule["professor"] or "")
+            buckets.setdefault(rule["course_name"], {}).setdefault(professor, []).append((rule["min_seats"], rule["id"]))
+
+        self.by_course = {}
+        self.professor_tokens = {}
+        for course_name, professors in buckets.items():
+            compiled = self.by_course[course_name] = {}
+            for professor, entries in professors.items():
+                entries.sort()
+                compiled[professor] = ([min_seats for min_seats, _ in entries], [rule_id for _, rule_id in entries])
+                self.professor_tokens[professor] = name_tokens(professor)
+
+    def courses(self) -> set:
+        """Get the names of all courses with a watch rule."""
+        return set(self.by_course)
+
+    def webhooks(self, course_name: str) -> set:
+        """Get the webhook URLs of everyone with a watch rule on a course."""
+        return {
+            self.rules[rule_id]["webhook_url"]
+            for _, rule_ids in self.by_course.get(course_name, {}).values()
+            for rule_id in rule_ids
+        }
+
+    def needs_professors(self, course_name: str) -> bool:
+        """Whether matching a course's sections needs their professors."""
+        return any(self.by_course.get(course_name, {}))
+
+    def match(self, course_name: str, sections: dict, professors: dict) -> dict:
+        """Check a course's full section list against its watch rules.
+
+        Args:
+            course_name: The course the sections belong to
+            sections: Maps CRNs to open seats for every section currently shown
+            professors: Maps CRNs to their professor, where known
+
+        Returns:
+            dict: Maps the ids of matched rules to {crn: seats} of the sections they matched
+        """
+        buckets = self.by_course.get(course_name)
+        if not buckets:
+            return {}
+
+        matches = {}
+        for crn, seats in sections.items():
+            section_tokens = name_tokens(professors.get(crn, ""))
+            for professor, (min_seats, rule_ids) in buckets.items():
+                # A rule's professor matches whole words of the listed instructor, e.g. "lee" in "lee, sang rae"
+                if professor and not professor_matches(self.professor_tokens[professor], section_tokens):
+                    continue
+                for rule_id in rule_ids[:bisect_right(min_seats, seats)]:
+                    matches.setdefault(rule_id, {})[crn] = seats
+        return matches
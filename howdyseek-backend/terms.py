@@ -0,0 +1,53 @@
+"""
+Per-term tab pools, so several terms and campuses are monitored from one browser
+"""
+
+from urllib.parse import quote
+
+from config import TAMU_SCHEDULER_BASE_URL
+from rules import RuleIndex
+
+
+class TermPool:
+    """Term selection, course tabs and section state of one registered term.
+
+    The same course name (and even CRN) can be offered in several terms, so everything the scraper
+    tracks per course is kept per term and course tabs are identified by (term ID, course name).
+    """
+
+    def __init__(self, term_id: int, name: str):
+        """Constructor.
+
+        Args:
+            term_id: The term's ID in the API
+            name: The term's name on the scheduler's term selection page, e.g. "Fall 2025 - College Station"
+        """
+        self.id = term_id
+        self.name = name
+        self.active = True
+        self.selected = False  # Whether the term has been picked on the term selection page
+        self.catalog_snapshotted = False  # Whether the term's catalog has been uploaded by this run
+        self.data = {}  # Maps CRNs to {"course", "prof", "crn", "webhooks", "profs"} for the term's watched sections
+        self.rules = RuleIndex()  # The term's compiled watch rules
+        self.monitored_courses = set()  # Courses of this term with an open tab
+        self.section_states = {}  # Maps course names to {crn: seats} dictionaries
+        self.rule_states = {}  # Maps course names to {rule id: {crn: seats}} of the sections each rule last matched
+        self.professors = {}  # Maps CRNs to their listed instructor, for watch rules on a professor
+
+    @property
+    def options_url(self) -> str:
+        """The term's course options page."""
+        return f"{TAMU_SCHEDULER_BASE_URL}/terms/{quote(self.name)}/options"
+
+    @property
+    def selector_xpath(self) -> str:
+        """The term's entry on the term selection page."""
+        return f'//*[@id="{self.name}"]'
+
+    def courses(self) -> set:
+        """Get the names of all courses with a watched section or a watch rule in this term."""
+        return {section["course"] for section in self.data.values()} | self.rules.courses()
+
+    def course_key(self, course_name: str) -> tuple:
+        """Identify a course across terms."""
+        return (self.id, course_name)
@@ -2,35 +2,68 @@ import React, {useState, useEffect, useCallback, useRef} from 'react';
 import {Bell, Settings, Trash2, Plus} from 'lucide-react';
 
 const API_BASE_URL = 'http://localhost:8000';
+const USER_PAGE_SIZE = 50;
+const LIST_PAGE_SIZE = 500;
+
+// Fetch every page of a paginated list endpoint by following the X-Next-Cursor header
+const fetchAllPages = async (path) => {
+    const items = [];
+    const params = new URLSearchParams({limit: LIST_PAGE_SIZE});
+    while (true) {
+        const response = await fetch(`${API_BASE_URL}${path}?${params}`);
+        if (!response.ok) throw new Error(`Failed to fetch ${path}`);
+        items.push(...await response.json());
+
+        const cursor = response.headers.get('X-Next-Cursor');
+        if (!cursor) return items;
+        params.set('cursor', cursor);
+    }
+};
 
 const App = () => {
     const [users, setUsers] = useState([]);
+    const [userSearch, setUserSearch] = useState('');
+    const [nextUserCursor, setNextUserCursor] = useState(null);
     const [selectedUser, setSelectedUser] = useState(null);
     const [courses, setCourses] = useState([]);
+    const [rules, setRules] = useState([]);
+    const [catalogMatches, setCatalogMatches] = useState([]);
+    const [terms, setTerms] = useState([]);
     const [isLoading, setIsLoading] = useState(true);
     const [activeTab, setActiveTab] = useState('courses');
     const [refreshSettings, setRefreshSettings] = useState({
         min_refresh_interval: 30,
-        max_refresh_interval: 40
+        max_refresh_interval: 40,
+        profiling_enabled: false,
+        requests_per_minute: 0
     });
 
     // Form refs instead of state for input fields
     const userFormRef = useRef(null);
     const courseFormRef = useRef(null);
+    const ruleFormRef = useRef(null);
     const settingsFormRef = useRef(null);
+    const termFormRef = useRef(null);
 
     // Modal states
     const [showAddUserModal, setShowAddUserModal] = useState(false);
     const [showAddCourseModal, setShowAddCourseModal] = useState(false);
+    const [showAddRuleModal, setShowAddRuleModal] = useState(false);
     const [showSettingsModal, setShowSettingsModal] = useState(false);
 
-    const fetchUsers = useCallback(async () => {
+    // Fetch a page of users. Without a cursor the list is replaced, with one the page is appended
+    const fetchUsers = useCallback(async (search = '', cursor = null) => {
         setIsLoading(true);
         try {
-            const response = await fetch(`${API_BASE_URL}/users/`);
+            const params = new URLSearchParams({limit: USER_PAGE_SIZE, sort: 'name'});
+            if (search) params.set('name', search);
+            if (cursor) params.set('cursor', cursor);
+
+            const response = await fetch(`${API_BASE_URL}/users/?${params}`);
             if (!response.ok) throw new Error('Failed to fetch users');
             const data = await response.json();
-            setUsers(data);
+            setUsers(prevUsers => (cursor ? [...prevUsers, ...data] : data));
+            setNextUserCursor(response.headers.get('X-Next-Cursor'));
         }
         catch (error) {
             console.error('Error fetching users:', error);
@@ -42,10 +75,7 @@ const App = () => {
     const fetchCourses = useCallback(async (userId) => {
         setIsLoading(true);
         try {
-            const response = await fetch(`${API_BASE_URL}/users/${userId}/courses`);
-            if (!response.ok) throw new Error('Failed to fetch courses');
-            const data = await response.json();
-            setCourses(data);
+            setCourses(await fetchAllPages(`/users/${userId}/courses`));
         }
         catch (error) {
             console.error('Error fetching courses:', error);
@@ -55,6 +85,49 @@ const App = () => {
         }
     }, []);
 
+    const fetchRules = useCallback(async (userId) => {
+        try {
+            setRules(await fetchAllPages(`/users/${userId}/rules`));
+        }
+        catch (error) {
+            console.error('Error fetching watch rules:', error);
+            setRules([]);
+        }
+    }, []);
+
+    // Autocomplete against the term catalog snapshotted by the scraper
+    const searchCatalog = async (field, query) => {
+        if (!query) {
+            setCatalogMatches([]);
+            return;
+        }
+        try {
+            const params = new URLSearchParams({q: query, field, limit: 20});
+            const form = showAddRuleModal ? ruleFormRef.current : courseFormRef.current;
+            const termId = form?.elements.term_id.value;
+            if (termId) params.set('term_id', termId);
+            const response = await fetch(`${API_BASE_URL}/catalog/search?${params}`);
+            if (!response.ok) throw new Error('Failed to search catalog');
+            setCatalogMatches(await response.json());
+        }
+        catch (error) {
+            console.error('Error searching catalog:', error);
+        }
+    };
+
+    // Fill in the course name and professor once a catalog CRN is picked
+    const handleCrnChange = (e) => {
+        const crn = e.target.value;
+        const match = catalogMatches.find(entry => entry.crn === crn);
+        if (match) {
+            courseFormRef.current.elements.course_name.value = match.course_name;
+            if (match.professor) {
+                courseFormRef.current.elements.professor.value = match.professor;
+            }
+        }
+        searchCatalog('crn', crn);
+    };
+
     const fetchSettings = useCallback(async () => {
         try {
             const response = await fetch(`${API_BASE_URL}/settings/`);
@@ -67,10 +140,27 @@ const App = () => {
         }
     }, []);
 
+    const fetchTerms = useCallback(async () => {
+        try {
+            const response = await fetch(`${API_BASE_URL}/terms/`);
+            if (!response.ok) throw new Error('Failed to fetch terms');
+            setTerms(await response.json());
+        }
+        catch (error) {
+            console.error('Error fetching terms:', error);
+        }
+    }, []);
+
     useEffect(() => {
-        fetchUsers();
         fetchSettings();
-    }, [fetchUsers, fetchSettings]);
+        fetchTerms();
+    }, [fetchSettings, fetchTerms]);
+
+    // Search on the server, debounced so typing doesn't send a request per keystroke
+    useEffect(() => {
+        const timeout = setTimeout(() => fetchUsers(userSearch), 250);
+        return () => clearTimeout(timeout);
+    }, [userSearch, fetchUsers]);
 
     useEffect(() => {
         if (users.length > 0 && !selectedUser) {
@@ -81,8 +171,9 @@ const App = () => {
     useEffect(() => {
         if (selectedUser) {
             fetchCourses(selectedUser.id);
+            fetchRules(selectedUser.id);
         }
-    }, [selectedUser, fetchCourses]);
+    }, [selectedUser, fetchCourses, fetchRules]);
 
     const handleUserSelect = (user) => {
         setSelectedUser(user);
@@ -112,7 +203,8 @@ const App = () => {
             if (!response.ok) throw new Error('Failed to add user');
 
             const createdUser = await response.json();
-            setUsers(prevUsers => [...prevUsers, createdUser]);
+            // Reload the first page so the new user lands in name order and "Load more" can't repeat it
+            fetchUsers(userSearch);
             setShowAddUserModal(false);
             setSelectedUser(createdUser);
 
@@ -132,8 +224,9 @@ const App = () => {
         const courseName = courseFormRef.current.elements.course_name.value;
         const crn = courseFormRef.current.elements.crn.value;
         const professor = courseFormRef.current.elements.professor.value;
+        const termId = parseInt(courseFormRef.current.elements.term_id.value, 10);
 
-        if (!courseName || !crn || !professor) {
+        if (!courseName || !crn || !professor || !termId) {
             alert('Please fill in all fields');
             return;
         }
@@ -147,11 +240,16 @@ const App = () => {
                 body: JSON.stringify({
                     course_name: courseName,
                     crn: crn,
-                    professor: professor
+                    professor: professor,
+                    term_id: termId
                 }),
             });
 
-            if (!response.ok) throw new Error('Failed to add course');
+            if (!response.ok) {
+                // Surface catalog validation errors such as a mistyped course or CRN
+                const error = await response.json().catch(() => ({}));
+                throw new Error(error.detail || 'Failed to add course');
+            }
 
             const createdCourse = await response.json();
             setCourses([...courses, createdCourse]);
@@ -166,6 +264,67 @@ const App = () => {
         }
     };
 
+    const handleAddRule = async (e) => {
+        e.preventDefault();
+
+        const courseName = ruleFormRef.current.elements.course_name.value;
+        const professor = ruleFormRef.current.elements.professor.value;
+        const minSeats = parseInt(ruleFormRef.current.elements.min_seats.value, 10);
+        const termId = parseInt(ruleFormRef.current.elements.term_id.value, 10);
+
+        if (!courseName || !termId) {
+            alert('Please fill in the course');
+            return;
+        }
+
+        try {
+            const response = await fetch(`${API_BASE_URL}/users/${selectedUser.id}/rules`, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify({
+                    course_name: courseName,
+                    professor: professor || null,
+                    min_seats: minSeats || 1,
+                    term_id: termId
+                }),
+            });
+
+            if (!response.ok) {
+                const error = await response.json().catch(() => ({}));
+                throw new Error(error.detail || 'Failed to add watch rule');
+            }
+
+            const createdRule = await response.json();
+            setRules([...rules, createdRule]);
+            setShowAddRuleModal(false);
+
+            // Reset form
+            ruleFormRef.current.reset();
+        }
+        catch (error) {
+            console.error('Error adding watch rule:', error);
+            alert('Failed to add watch rule: ' + error.message);
+        }
+    };
+
+    const handleDeleteRule = async (ruleId) => {
+        try {
+            const response = await fetch(`${API_BASE_URL}/rules/${ruleId}`, {
+                method: 'DELETE',
+            });
+
+            if (!response.ok) throw new Error('Failed to delete watch rule');
+
+            setRules(rules.filter(rule => rule.id !== ruleId));
+        }
+        catch (error) {
+            console.error('Error deleting watch rule:', error);
+            alert('Failed to delete watch rule: ' + error.message);
+        }
+    };
+
     const handleDeleteCourse = async (courseId) => {
         try {
             const response = await fetch(`${API_BASE_URL}/courses/${courseId}`, {
@@ -223,7 +382,9 @@ const App = () => {
 
         const settings = {
             min_refresh_interval: minInterval,
-            max_refresh_interval: maxInterval
+            max_refresh_interval: maxInterval,
+            profiling_enabled: settingsFormRef.current.elements.profiling_enabled.checked,
+            requests_per_minute: parseFloat(settingsFormRef.current.elements.requests_per_minute.value)
         };
 
         try {
@@ -248,6 +409,80 @@ const App = () => {
         }
     };
 
+    const handleAddTerm = async () => {
+        const name = termFormRef.current.value.trim();
+        if (!name) return;
+
+        try {
+            const response = await fetch(`${API_BASE_URL}/terms/`, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify({name: name}),
+            });
+
+            if (!response.ok) {
+                const error = await response.json().catch(() => ({}));
+                throw new Error(error.detail || 'Failed to add term');
+            }
+
+            const createdTerm = await response.json();
+            setTerms([...terms, createdTerm]);
+            termFormRef.current.value = '';
+        }
+        catch (error) {
+            console.error('Error adding term:', error);
+            alert('Failed to add term: ' + error.message);
+        }
+    };
+
+    const handleToggleTerm = async (term) => {
+        try {
+            const response = await fetch(`${API_BASE_URL}/terms/${term.id}`, {
+                method: 'PUT',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify({active: !term.active}),
+            });
+
+            if (!response.ok) throw new Error('Failed to update term');
+
+            const updatedTerm = await response.json();
+            setTerms(terms.map(t => (t.id === updatedTerm.id ? updatedTerm : t)));
+        }
+        catch (error) {
+            console.error('Error updating term:', error);
+            alert('Failed to update term: ' + error.message);
+        }
+    };
+
+    const handleDeleteTerm = async (termId) => {
+        try {
+            const response = await fetch(`${API_BASE_URL}/terms/${termId}`, {
+                method: 'DELETE',
+            });
+
+            if (!response.ok) {
+                // A term can't be deleted while anyone still watches courses in it
+                const error = await response.json().catch(() => ({}));
+                throw new Error(error.detail || 'Failed to delete term');
+            }
+
+            setTerms(terms.filter(term => term.id !== termId));
+        }
+        catch (error) {
+            console.error('Error deleting term:', error);
+            alert('Failed to delete term: ' + error.message);
+        }
+    };
+
+    const termName = (termId) => {
+        const term = terms.find(t => t.id === termId);
+        return term ? term.name : '';
+    };
+
     // Modal component
     const Modal = ({isOpen, onClose, title, children}) => {
         if (!isOpen) return null;
@@ -277,7 +512,7 @@ const App = () => {
     };
 
     // Render loading state
-    if (isLoading && users.length === 0) {
+    if (isLoading && users.length === 0 && !userSearch) {
         return (
             <div className="flex justify-center items-center h-screen bg-gray-100">
                 <div className="text-center bg-white p-8 rounded-lg shadow-md">
@@ -326,9 +561,19 @@ const App = () => {
                                 </button>
                             </div>
 
+                            <input
+                                type="search"
+                                value={userSearch}
+                                onChange={(e) => setUserSearch(e.target.value)}
+                                placeholder="Search users"
+                                className="mb-4 w-full px-3 py-2 border border-gray-300 rounded-md text-sm focus:outline-none focus:ring-red-800 focus:border-red-800"
+                            />
+
                             <div className="space-y-2">
                                 {users.length === 0 ? (
-                                    <p className="text-gray-500 text-sm">No users added yet.</p>
+                                    <p className="text-gray-500 text-sm">
+                                        {userSearch ? 'No matching users.' : 'No users added yet.'}
+                                    </p>
                                 ) : (
                                     users.map(user => (
                                         <div
@@ -356,6 +601,16 @@ const App = () => {
                                     ))
                                 )}
                             </div>
+
+                            {nextUserCursor && (
+                                <button
+                                    className="mt-4 w-full text-sm text-red-800 hover:text-red-900 py-1"
+                                    onClick={() => fetchUsers(userSearch, nextUserCursor)}
+                                    disabled={isLoading}
+                                >
+                                    Load more
+                                </button>
+                            )}
                         </div>
                     </div>
 
@@ -370,7 +625,7 @@ const App = () => {
                                                 {selectedUser.name}
                                             </h2>
                                         </div>
-                                        <div>
+                                        <div className="flex space-x-2">
                                             <button
                                                 className="text-sm bg-red-800 hover:bg-red-900 text-white py-1 px-3 rounded flex items-center"
                                                 onClick={() => setShowAddCourseModal(true)}
@@ -378,6 +633,13 @@ const App = () => {
                                                 <Plus size={16} className="mr-1"/>
                                                 Add Course
                                             </button>
+                                            <button
+                                                className="text-sm bg-white border border-red-800 text-red-800 hover:bg-red-50 py-1 px-3 rounded flex items-center"
+                                                onClick={() => setShowAddRuleModal(true)}
+                                            >
+                                                <Plus size={16} className="mr-1"/>
+                                                Add Watch Rule
+                                            </button>
                                         </div>
                                     </div>
                                 </div>
@@ -451,6 +713,10 @@ const App = () => {
                                                                     className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">
                                                                     CRN
                                                                 </th>
+                                                                <th scope="col"
+                                                                    className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">
+                                                                    Term
+                                                                </th>
                                                                 <th scope="col"
                                                                     className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">
                                                                     Professor
@@ -471,6 +737,10 @@ const App = () => {
                                                                         <div
                                                                             className="text-gray-900">{course.crn}</div>
                                                                     </td>
+                                                                    <td className="px-6 py-4 whitespace-nowrap">
+                                                                        <div
+                                                                            className="text-gray-900">{termName(course.term_id)}</div>
+                                                                    </td>
                                                                     <td className="px-6 py-4 whitespace-nowrap">
                                                                         <div
                                                                             className="text-gray-900">{course.professor}</div>
@@ -490,6 +760,34 @@ const App = () => {
                                                         </table>
                                                     </div>
                                                 )}
+
+                                                {rules.length > 0 && (
+                                                    <div className="mt-6">
+                                                        <h3 className="text-sm font-medium text-gray-500 uppercase tracking-wider mb-2">
+                                                            Watch Rules
+                                                        </h3>
+                                                        <ul className="divide-y divide-gray-200 border rounded-md">
+                                                            {rules.map(rule => (
+                                                                <li key={rule.id}
+                                                                    className="flex items-center justify-between px-6 py-3 hover:bg-gray-50">
+                                                                    <div className="text-gray-900">
+                                                                        Any <span className="font-medium">{rule.course_name}</span> section
+                                                                        {rule.professor ? ` with ${rule.professor}` : ''}
+                                                                        {rule.min_seats > 1 ? `, at least ${rule.min_seats} seats` : ''}
+                                                                        <span className="text-gray-500"> ({termName(rule.term_id)})</span>
+                                                                    </div>
+                                                                    <button
+                                                                        className="text-red-600 hover:text-red-900 flex items-center text-sm font-medium"
+                                                                        onClick={() => handleDeleteRule(rule.id)}
+                                                                    >
+                                                                        <Trash2 size={16} className="mr-1"/>
+                                                                        Delete
+                                                                    </button>
+                                                                </li>
+                                                            ))}
+                                                        </ul>
+                                                    </div>
+                                                )}
                                             </div>
                                         ) : (
                                             <div className="max-w-md mx-auto">
@@ -600,23 +898,53 @@ const App = () => {
                 title="Add Course to Monitor"
             >
                 <form ref={courseFormRef} onSubmit={handleAddCourse} className="space-y-4">
+                    <div>
+                        <label className="block text-sm font-medium text-gray-700">Term</label>
+                        <select
+                            name="term_id"
+                            onChange={() => setCatalogMatches([])}
+                            className="mt-1 block w-full rounded-md border-gray-300 shadow-sm focus:border-red-500 focus:ring-red-500"
+                        >
+                            {terms.filter(term => term.active).map(term => (
+                                <option key={term.id} value={term.id}>{term.name}</option>
+                            ))}
+                        </select>
+                    </div>
                     <div>
                         <label className="block text-sm font-medium text-gray-700">Course Name</label>
                         <input
                             type="text"
                             name="course_name"
+                            list="catalog-course-names"
+                            autoComplete="off"
+                            onChange={(e) => searchCatalog('course_name', e.target.value)}
                             className="mt-1 block w-full rounded-md border-gray-300 shadow-sm focus:border-red-500 focus:ring-red-500"
                             placeholder="MATH 251"
                         />
+                        <datalist id="catalog-course-names">
+                            {[...new Set(catalogMatches.map(entry => entry.course_name))].map(name => (
+                                <option key={name} value={name}/>
+                            ))}
+                        </datalist>
                     </div>
                     <div>
                         <label className="block text-sm font-medium text-gray-700">CRN</label>
                         <input
                             type="text"
                             name="crn"
+                            list="catalog-crns"
+                            autoComplete="off"
+                            onChange={handleCrnChange}
                             className="mt-1 block w-full rounded-md border-gray-300 shadow-sm focus:border-red-500 focus:ring-red-500"
                             placeholder="123456"
                         />
+                        <datalist id="catalog-crns">
+                            {catalogMatches.map(entry => (
+                                <option key={entry.crn} value={entry.crn}>
+                                    {entry.course_name}{entry.professor ? ` with ${entry.professor}` : ''}
+                                </option>
+                            ))}
+                        </datalist>
                     </div>
                     <div>
                         <label className="block text-sm font-medium text-gray-700">Professor</label>
@@ -638,6 +966,73 @@ const App = () => {
                 </form>
             </Modal>
 
+            {/* Add Watch Rule Modal */}
+            <Modal
+                isOpen={showAddRuleModal}
+                onClose={() => setShowAddRuleModal(false)}
+                title="Watch Any Matching Section"
+            >
+                <form ref={ruleFormRef} onSubmit={handleAddRule} className="space-y-4">
+                    <div>
+                        <label className="block text-sm font-medium text-gray-700">Term</label>
+                        <select
+                            name="term_id"
+                            onChange={() => setCatalogMatches([])}
+                            className="mt-1 block w-full rounded-md border-gray-300 shadow-sm focus:border-red-500 focus:ring-red-500"
+                        >
+                            {terms.filter(term => term.active).map(term => (
+                                <option key={term.id} value={term.id}>{term.name}</option>
+                            ))}
+                        </select>
+                    </div>
+                    <div>
+                        <label className="block text-sm font-medium text-gray-700">Course Name</label>
+                        <input
+                            type="text"
+                            name="course_name"
+                            list="rule-course-names"
+                            autoComplete="off"
+                            onChange={(e) => searchCatalog('course_name', e.target.value)}
+                            className="mt-1 block w-full rounded-md border-gray-300 shadow-sm focus:border-red-500 focus:ring-red-500"
+                            placeholder="CSCE 314"
+                        />
+                        <datalist id="rule-course-names">
+                            {[...new Set(catalogMatches.map(entry => entry.course_name))].map(name => (
+                                <option key={name} value={name}/>
+                            ))}
+                        </datalist>
+                    </div>
+                    <div>
+                        <label className="block text-sm font-medium text-gray-700">Professor (optional)</label>
+                        <input
+                            type="text"
+                            name="professor"
+                            className="mt-1 block w-full rounded-md border-gray-300 shadow-sm focus:border-red-500 focus:ring-red-500"
+                            placeholder="Any professor"
+                        />
+                    </div>
+                    <div>
+                        <label className="block text-sm font-medium text-gray-700">Minimum Open Seats</label>
+                        <input
+                            type="number"
+                            name="min_seats"
+                            min="1"
+                            step="1"
+                            defaultValue={1}
+                            className="mt-1 block w-full rounded-md border-gray-300 shadow-sm focus:border-red-500 focus:ring-red-500"
+                        />
+                    </div>
+                    <div className="pt-2">
+                        <button
+                            type="submit"
+                            className="w-full inline-flex justify-center rounded-md border border-transparent shadow-sm px-4 py-2 bg-red-800 text-base font-medium text-white hover:bg-red-900 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-red-500"
+                        >
+                            Add Watch Rule
+                        </button>
+                    </div>
+                </form>
+            </Modal>
+
             {/* Settings Modal */}
             <Modal
                 isOpen={showSettingsModal}
@@ -668,6 +1063,76 @@ const App = () => {
                             className="mt-1 block w-full rounded-md border-gray-300 shadow-sm focus:border-red-500 focus:ring-red-500"
                             defaultValue={refreshSettings.max_refresh_interval}
                         />
+                        {refreshSettings.requests_per_minute > 0 && (
+                            <p className="mt-1 text-xs text-gray-500">
+                                Ignored while a request budget is set, the budget paces refreshes instead.
+                            </p>
+                        )}
+                    </div>
+                    <div>
+                        <label className="block text-sm font-medium text-gray-700">Request Budget
+                            (requests per minute, 0 to use the refresh interval)</label>
+                        <input
+                            type="number"
+                            name="requests_per_minute"
+                            min="0"
+                            step="1"
+                            className="mt-1 block w-full rounded-md border-gray-300 shadow-sm focus:border-red-500 focus:ring-red-500"
+                            defaultValue={refreshSettings.requests_per_minute}
+                        />
+                    </div>
+                    <div className="flex items-center">
+                        <input
+                            type="checkbox"
+                            name="profiling_enabled"
+                            id="profiling_enabled"
+                            className="rounded border-gray-300 text-red-800 focus:ring-red-500"
+                            defaultChecked={refreshSettings.profiling_enabled}
+                        />
+                        <label htmlFor="profiling_enabled" className="ml-2 block text-sm text-gray-700">
+                            Profile monitoring cycles
+                        </label>
+                    </div>
+                    <div>
+                        <label className="block text-sm font-medium text-gray-700">Terms</label>
+                        <ul className="mt-1 divide-y divide-gray-200 border rounded-md">
+                            {terms.map(term => (
+                                <li key={term.id} className="flex items-center justify-between px-3 py-2 text-sm">
+                                    <span className={term.active ? 'text-gray-900' : 'text-gray-400'}>{term.name}</span>
+                                    <span className="flex items-center">
+                                        <button
+                                            type="button"
+                                            className="text-gray-600 hover:text-gray-900 mr-3"
+                                            onClick={() => handleToggleTerm(term)}
+                                        >
+                                            {term.active ? 'Pause' : 'Resume'}
+                                        </button>
+                                        <button
+                                            type="button"
+                                            className="text-red-600 hover:text-red-900"
+                                            onClick={() => handleDeleteTerm(term.id)}
+                                        >
+                                            <Trash2 size={16}/>
+                                        </button>
+                                    </span>
+                                </li>
+                            ))}
+                        </ul>
+                        <div className="mt-2 flex">
+                            <input
+                                type="text"
+                                ref={termFormRef}
+                                className="block w-full rounded-md border-gray-300 shadow-sm focus:border-red-500 focus:ring-red-500"
+                                placeholder="Spring 2026 - College Station"
+                            />
+                            <button
+                                type="button"
+                                className="ml-2 text-sm bg-red-800 hover:bg-red-900 text-white py-2 px-3 rounded flex items-center"
+                                onClick={handleAddTerm}
+                            >
+                                <Plus size={16}/>
+                            </button>
+                        </div>
                     </div>
                     <div className="pt-2">
                         <button